@@ -3,29 +3,316 @@ Library for interacting with Tello drones using the v2.0 and v1.3 versions of th
 Made by zahtec (https://www.github.com/zahtec/tellodji)
 '''
 
-from os import mkdir
-from time import sleep
-from queue import Queue
+from os import makedirs, cpu_count
+from select import select
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from getpass import getpass
-from os.path import abspath
-from re import findall, match
+from os.path import abspath, isdir
+from tempfile import mkdtemp
+from re import compile as recompile
 from datetime import datetime
+from sys import intern
+from functools import lru_cache
 from ipaddress import ip_address
 from shutil import rmtree, which
-from http.server import HTTPServer
-from socket import AF_INET6, SHUT_RDWR, socket, SOCK_DGRAM, AF_INET
-from .tello_web import _TelloWebLive, _TelloWebRec
-from webbrowser import open as openweb
-from PIL.Image import open as openimg
-from .tello_decor import tello_decor
-from threading import Thread, Event
+from socket import AF_INET6, socket, socketpair, SOCK_DGRAM, AF_INET, SOL_SOCKET, SO_RCVBUF, SO_SNDBUF
+from .tello_queue import _TelloQueue
+from .tello_decor import tello_decor, validate
+from threading import Thread, Event, Lock
 from typing import Callable, Union, Literal
-from subprocess import Popen, PIPE
+from subprocess import Popen, PIPE, TimeoutExpired
 from.tello_error import TelloError
 
 MISSION_PAD = Union[Literal['m1'], Literal['m2'], Literal['m3'],
                     Literal['m4'], Literal['m5'], Literal['m6'], Literal['m7'], Literal['m8']]
 
+_MPAD_IDS = frozenset(f'm{i}' for i in range(1, 9))
+# State keys the drone only sends while mission pad detection is enabled
+_MPAD_KEYS = frozenset(('mid', 'x', 'y', 'z', 'mpry'))
+
+# Tags queued with each command so the command thread can tell which ones need extra handling without scanning them
+_KIND_NORMAL, _KIND_STREAMON, _KIND_STREAMOFF, _KIND_WIFI = range(4)
+_KINDS = {'streamon': _KIND_STREAMON, 'streamoff': _KIND_STREAMOFF}
+
+_SETSPD_FMT = '%s %d'
+# Templates for the variable length commands indexed by their number of values, so they're formatted in one step instead of joined
+_ARGS_FMT = tuple(' '.join(['%s'] * (n + 1)) for n in range(9))
+_WIFI_FMT = '%s %s %s'
+# At least 2 lowercase letters, 2 uppercase letters and 1 number
+_WIFI_PWD = recompile(r'(?=(?:[^a-z]*[a-z]){2})(?=(?:[^A-Z]*[A-Z]){2})(?=(?:[^0-9]*[0-9]){1})')
+_MPAD_FMT = '%s %d'
+
+# Kernel buffer size requested for the command and state sockets. Capped by net.core.rmem_max/wmem_max on Linux
+_SOCK_BUF = 1 << 20
+
+# Address the preview webservers bind to. Port 0 lets the OS pick a free unprivileged port
+_WEB_ADDR = ('127.0.0.1', 0)
+
+# Input flags that stop ffmpeg from buffering and probing the drones UDP stream before handing out the first frame
+_FFMPEG_LOWLAT = ['-fflags', 'nobuffer', '-flags', 'low_delay', '-probesize', '32', '-analyzeduration', '0',
+                  '-avioflags', 'direct', '-max_delay', '0']
+
+# Decoder threading for the throughput bound paths. Frame threading costs a frame of latency per thread so the live feed doesn't use it
+_FFMPEG_THREADS = ['-threads', str(min(8, cpu_count() or 1)), '-thread_type', 'slice+frame']
+
+# Encoder flags for the live feed so x264 emits each frame as soon as it is encoded instead of holding a lookahead window
+_FFMPEG_ZEROLAT = ['-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'zerolatency',
+                   '-x264opts', 'no-mbtree:sliced-threads:sync-lookahead=0:rc-lookahead=0']
+
+# Frames video_bytes allocates at once. Kept small so buffers grow with the frames actually read
+_FRAME_CHUNK = 16
+
+# Frames the video_bytes decoder pipe is grown to hold, so ffmpeg can run ahead of the reader
+_PIPE_FRAMES = 8
+
+# Relative, absolute and home paths. Windows drive paths are checked separately by their colon
+_PATH_PREFIXES = ('./', '../', '/', '~/')
+
+# Constructor preference specs as key: (check, error type, error message), checked in this order
+_PREFERENCES = {
+    'default_distance': (lambda v: type(v) is int and 20 <= v, ValueError,
+                         'Default distance value provided was invalid. Please make sure it\'s a valid integer and at at least 20cm'),
+    'default_rotation': (lambda v: type(v) is int and 1 <= v <= 360, ValueError,
+                         'Default rotation value provided was invalid. Please make sure it\'s a valid integer and in between 1 - 360deg'),
+    'default_speed': (lambda v: type(v) is int and 10 <= v <= 60, ValueError,
+                      'Default speed value provided was invalid. Please make sure it\'s a valid integer and between 10 - 60cm/s'),
+    'timeout': (lambda v: type(v) is int and 0 <= v, ValueError,
+                'Timeout value provided was invalid. Please make sure it\'s a valid integer and at least 0'),
+    'mission_pad': (lambda v: type(v) is bool, TypeError,
+                    'Mission pad preference provided was invalid. Please make sure it\'s a valid boolean type'),
+    'safety': (lambda v: type(v) is bool, TypeError,
+               'Safety preference provided was invalid. Please make sure it\'s a valid boolean type'),
+    'sync': (lambda v: type(v) is bool or callable(v), TypeError,
+             'Sync preference provided was invalid. Please make sure it\'s a valid boolean type or a callable'),
+    'takeoff': (lambda v: type(v) is bool, TypeError,
+                'Takeoff preference provided was invalid. Please make sure it\'s a valid boolean type'),
+    'syncfix': (lambda v: type(v) is bool, TypeError,
+                'Syncfix preference provided was invalid. Please make sure it\'s a valid boolean type'),
+    'debug': (lambda v: type(v) is bool, TypeError,
+              'Debug preference provided was invalid. Please make sure it\'s a valid boolean type'),
+    'video': (lambda v: type(v) is bool, TypeError,
+              'Video preference provided was invalid. Please make sure it\'s a valid boolean type'),
+}
+
+# Argument specs used with the validate decorator as (check, error type, error message)
+_PATH = (lambda v: isinstance(v, str) and (v.startswith(_PATH_PREFIXES) or v[1:2] == ':'), ValueError,
+         'Provided path was invalid. Please make sure it\'s a valid string and in proper path format')
+_RESOLUTION = (lambda v: isinstance(v, tuple) and len(v) == 2 and type(v[0]) is int and type(v[1]) is int, ValueError,
+               'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
+_FRAMERATE = (lambda v: type(v) is int and 10 <= v <= 60, ValueError,
+              'Provided framerate was invalid. Please make sure it\'s a valid integer and inbetween 10 - 60')
+_WINDOW = (lambda v: isinstance(v, bool), TypeError,
+           'Window preference provided was invalid. Please make sure it\'s a valid boolean type')
+_CALLBACK_ERR = 'Callback function is incorrect. Please make sure it\'s a callable'
+_CALLBACK_ANY = (lambda v: v is False or v is None or callable(v), TypeError, _CALLBACK_ERR)
+_CALLBACK_BLOCKING = (lambda v: v is False or callable(v), TypeError, _CALLBACK_ERR)
+_CALLBACK_ASYNC = (lambda v: v is None or callable(v), TypeError, _CALLBACK_ERR)
+_WIFI = (lambda v: v is None or isinstance(v, str), TypeError,
+         'WiFi value provided was invalid. Please make sure it\'s a valid string or None')
+_MPAD_DIR = (lambda v: type(v) is int and 0 <= v <= 2, ValueError,
+             'Mission Pad Detection value is incorrect. Please make sure it\'s a valid integer and between 0 - 2')
+_FORMAT = (lambda v: v in ('jpeg', 'png'), ValueError,
+           'Provided format was invalid. Please make sure it\'s either \'jpeg\' or \'png\'')
+_FRAMES = (lambda v: type(v) is int, TypeError,
+           'Provided frame count was invalid. Please make sure it\'s a valid integer')
+_REALTIME = (lambda v: isinstance(v, bool), TypeError,
+             'Realtime preference provided was invalid. Please make sure it\'s a valid boolean type')
+_BATCH = (lambda v: type(v) is int and v >= 0, ValueError,
+          'Provided batch size was invalid. Please make sure it\'s a valid integer and at least 0')
+_HWACCEL = (lambda v: v in (None, 'auto', 'cuda', 'vaapi', 'qsv', 'videotoolbox', 'd3d11va', 'dxva2'), ValueError,
+            'Provided hardware acceleration was invalid. Please make sure it\'s None or one of \'auto\', \'cuda\', \'vaapi\', \'qsv\', \'videotoolbox\', \'d3d11va\' or \'dxva2\'')
+
+
+def _sockbuf(sock: socket) -> socket:
+    '''
+    Internal function for enlarging a sockets kernel buffers so bursts of state packets and responses aren't dropped while Python is busy.
+    Silently keeps the defaults if the system doesn't allow the size. Returns the socket. You normally wouldn't use this yourself
+    '''
+
+    for opt in (SO_RCVBUF, SO_SNDBUF):
+        try:
+            sock.setsockopt(SOL_SOCKET, opt, _SOCK_BUF)
+        except OSError:
+            pass
+
+    return sock
+
+
+def _state_error(key: str) -> TelloError:
+    '''
+    Internal function for building the error for a state value that isn't in the latest state packet. You normally wouldn't use this yourself
+    '''
+
+    if key in _MPAD_KEYS:
+        return TelloError(
+            'The status requested is only available when mission pads are enabled. Please run the Tello.set_mission_pad() method first to use this method')
+
+    return TelloError(
+        'The status requested hasn\'t been received from the drone yet. Please make sure you are connected to your Tello drone')
+
+
+def _lowdelay(sock: socket) -> socket:
+    '''
+    Internal function for marking a sockets packets as low delay so Linux qdiscs and WiFi QoS queue them ahead of bulk traffic.
+    SO_PRIORITY is only supported on Linux and either option is skipped when unavailable. Returns the socket. You normally wouldn't use this yourself
+    '''
+
+    try:
+        from socket import IPPROTO_IP, IP_TOS
+
+        if sock.family == AF_INET:
+            sock.setsockopt(IPPROTO_IP, IP_TOS, 0x10)
+    except (ImportError, OSError):
+        pass
+
+    try:
+        from socket import SO_PRIORITY
+
+        sock.setsockopt(SOL_SOCKET, SO_PRIORITY, 6)
+    except (ImportError, OSError):
+        pass
+
+    return sock
+
+
+@lru_cache(maxsize=1)
+def _has_ffmpeg() -> bool:
+    '''
+    Internal function for checking whether ffmpeg is installed. The result is cached as ffmpeg won't move during a session. You normally wouldn't use this yourself
+    '''
+
+    return which('ffmpeg') != None
+
+
+def _readframe(stream, mv: memoryview) -> int:
+    '''
+    Internal function for reading a single raw frame from an ffmpeg pipe into a preallocated buffer without allocating a new bytes object.
+    Returns the amount of bytes read, which is only less than the buffer size if the pipe was closed. You normally wouldn't use this yourself
+    '''
+
+    size = len(mv)
+    n = 0
+
+    while n < size:
+        k = stream.readinto(mv[n:])
+        if not k:
+            break
+        n += k
+
+    return n
+
+
+def _readframes(stream, rb: int, count: int, keep: Callable[[], bool]) -> list[memoryview]:
+    '''
+    Internal function for reading raw frames of rb bytes from an ffmpeg pipe. Reads count frames, or as long as keep() is true if count is 0.
+    Frames are read into buffers allocated _FRAME_CHUNK frames at a time (or count frames if fewer) and returned as memoryviews of them. You normally wouldn't use this yourself
+    '''
+
+    # Small blocks so a short grab doesn't commit memory for frames it never reads
+    size = min(count, _FRAME_CHUNK) if count else _FRAME_CHUNK
+    ret = []
+
+    while len(ret) < count if count else keep():
+        i = len(ret) % size
+        if not i:
+            buf = memoryview(bytearray(size * rb))
+
+        frame = buf[i * rb:(i + 1) * rb]
+        if _readframe(stream, frame) < rb:
+            break
+        ret.append(frame)
+
+    return ret
+
+
+@lru_cache(maxsize=16)
+def _stream_input(ip: str, port: int, to: Union[int, float, None]) -> tuple[str, ...]:
+    '''
+    Internal function for building the ffmpeg input arguments for the drones video stream. Cached since they only change along with the IPs, ports or timeout. You normally wouldn't use this yourself
+    '''
+
+    return ('-f', 'h264', '-i', f'udp://{ip}:{port}' + (f'?timeout={(to/3.2) * 1000000}' if to else ''))
+
+
+def _growpipe(stream, size: int) -> None:
+    '''
+    Internal function for growing an ffmpeg output pipe so it can hold size bytes, capped at the systems max pipe size. Lets each read pull in
+    most of a frame at once instead of the default 64 KiB. Only supported on Linux and skipped otherwise. You normally wouldn't use this yourself
+    '''
+
+    try:
+        from fcntl import fcntl, F_SETPIPE_SZ
+
+        with open('/proc/sys/fs/pipe-max-size') as f:
+            size = min(size, int(f.read()))
+
+        fcntl(stream.fileno(), F_SETPIPE_SZ, size)
+    except (ImportError, OSError):
+        pass
+
+
+def _ready(stream, timeout: Union[int, float, None]) -> bool:
+    '''
+    Internal function for waiting up to timeout seconds for an ffmpeg output pipe to become readable without reading from it. Uses select where supported
+    and polls the pipe on Windows, where select only accepts sockets. You normally wouldn't use this yourself
+    '''
+
+    try:
+        from msvcrt import get_osfhandle
+        from _winapi import PeekNamedPipe
+        from time import monotonic, sleep
+    except ImportError:
+        return bool(select([stream], [], [], timeout)[0])
+
+    handle = get_osfhandle(stream.fileno())
+    end = None if timeout is None else monotonic() + timeout
+
+    while True:
+        try:
+            if PeekNamedPipe(handle, 0)[0]:
+                return True
+        except OSError:
+            # A closed pipe counts as readable like it does with select so the next read sees ffmpeg has exited
+            return True
+
+        if end is not None and monotonic() >= end:
+            return False
+        sleep(0.01)
+
+
+def _stop(proc: Popen, timeout: Union[int, float, None] = 1) -> None:
+    '''
+    Internal function for stopping an ffmpeg process. It's sent SIGINT so it can finalize its output and is killed if it hasn't exited within the timeout. You normally wouldn't use this yourself
+    '''
+
+    try:
+        proc.send_signal(2)
+    except ValueError:
+        # Windows can't send SIGINT to a single process so it's terminated instead
+        proc.terminate()
+
+    try:
+        proc.wait(timeout)
+    except TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _realtime() -> None:
+    '''
+    Internal function for giving the calling frame pump thread realtime priority and pinning it to the last available cpu, away from the main interpreter.
+    Only supported on Linux and skipped when not permitted. You normally wouldn't use this yourself
+    '''
+
+    try:
+        from os import sched_setscheduler, sched_param, sched_getaffinity, sched_setaffinity, SCHED_FIFO
+
+        # Only pinned once realtime priority was granted so an unprivileged thread isn't left stuck on one cpu
+        sched_setscheduler(0, SCHED_FIFO, sched_param(10))
+        sched_setaffinity(0, {max(sched_getaffinity(0))})
+    except (ImportError, PermissionError):
+        pass
+
 
 class Tello:
     '''
@@ -70,6 +357,10 @@ class Tello:
     HD = (960, 720)
     SD = (640, 480)
 
+    __slots__ = ('_ips', '_ports', '_caddr', '_to', '_running', '_flying', '_rec', '_web', '_frames', '_live', '_streaming', '_cqueue', '_slist',
+                 '_sevent', '_slock', '_swake', '_dd', '_dr', '_spd', '_sm', '_sync', '_oos', '_mp', '_debug', '_cserver', '_sserver',
+                 '_send_', '_checkfly_')
+
     def __init__(self, ips: tuple[Union[str, None], Union[str, None]] = ('192.168.10.1', '0.0.0.0'), ports: tuple[Union[int, None], Union[int, None], Union[int, None]] = (8889, 8890, 11111), **preferences: Union[int, bool]) -> None:
         if len(ips) != 2 or (ips[0] and ips[1] == None):
             raise ValueError(
@@ -77,39 +368,10 @@ class Tello:
         elif len(ports) != 3 or (ports[0] and ports[1] and ports[2] == None):
             raise ValueError(
                 'Ports provided were invalid. Please make sure it\'s a valid tuple with at least 1 port with others inputted as None')
-        elif 'default_distance' in preferences and (type(preferences['default_distance']) is not int or not 20 <= preferences['default_distance']):
-            raise ValueError(
-                'Default distance value provided was invalid. Please make sure it\'s a valid integer and at at least 20cm')
-        elif 'default_rotation' in preferences and (type(preferences['default_rotation']) is not int or not 1 <= preferences['default_rotation'] <= 360):
-            raise ValueError(
-                'Default rotation value provided was invalid. Please make sure it\'s a valid integer and in between 1 - 360deg')
-        elif 'default_speed' in preferences and (type(preferences['default_speed']) is not int or not 10 <= preferences['default_speed'] <= 60):
-            raise ValueError(
-                'Default speed value provided was invalid. Please make sure it\'s a valid integer and between 10 - 60cm/s')
-        elif 'timeout' in preferences and (type(preferences['timeout']) is not int or not 0 <= preferences['timeout']):
-            raise ValueError(
-                'Timeout value provided was invalid. Please make sure it\'s a valid integer and at least 0')
-        elif 'mission_pad' in preferences and type(preferences['mission_pad']) is not bool:
-            raise TypeError(
-                'Mission pad preference provided was invalid. Please make sure it\'s a valid boolean type')
-        elif 'safety' in preferences and type(preferences['safety']) is not bool:
-            raise TypeError(
-                'Safety preference provided was invalid. Please make sure it\'s a valid boolean type')
-        elif 'sync' in preferences and not (type(preferences['sync']) is bool or callable(preferences['sync'])):
-            raise TypeError(
-                'Sync preference provided was invalid. Please make sure it\'s a valid boolean type or a callable')
-        elif 'takeoff' in preferences and type(preferences['takeoff']) is not bool:
-            raise TypeError(
-                'Takeoff preference provided was invalid. Please make sure it\'s a valid boolean type')
-        elif 'syncfix' in preferences and type(preferences['syncfix']) is not bool:
-            raise TypeError(
-                'Syncfix preference provided was invalid. Please make sure it\'s a valid boolean type')
-        elif 'debug' in preferences and type(preferences['debug']) is not bool:
-            raise TypeError(
-                'Debug preference provided was invalid. Please make sure it\'s a valid boolean type')
-        elif 'video' in preferences and type(preferences['video']) is not bool:
-            raise TypeError(
-                'Video preference provided was invalid. Please make sure it\'s a valid boolean type')
+
+        for key, (check, err, msg) in _PREFERENCES.items():
+            if key in preferences and not check(preferences[key]):
+                raise err(msg)
 
         for ip in ips:
             if ip:
@@ -119,8 +381,9 @@ class Tello:
                      ips[1] if ips[1] else '0.0.0.0')
         self._ports = (ports[0] if ports[0] else 8889, ports[1]
                        if ports[1] else 8890, ports[2] if ports[2] else 11111)
-        self._to = (int(preferences['timeout']) if preferences['timeout']
-                    > 0 else None) if 'timeout' in preferences else 7
+        # The command address is read on every send so it's kept prebuilt
+        self._caddr = (self._ips[0], self._ports[0])
+        self._to = int(preferences.get('timeout', 7)) or None
         self._running = True
         self._flying = False
         self._rec = False
@@ -128,35 +391,34 @@ class Tello:
         self._frames = False
         self._live = False
         self._streaming = True
-        self._cqueue = Queue()
+        self._cqueue = _TelloQueue()
         self._slist = {}
         self._sevent = Event()
         self._sevent.set()
-
-        self._dd = int(preferences['default_distance']
-                       ) if 'default_distance' in preferences else 50
-        self._dr = int(preferences['default_rotation']
-                       ) if 'default_rotation' in preferences else 90
-        self._spd = int(preferences['default_speed']
-                        ) if 'default_speed' in preferences else 30
-        self._sm = bool(preferences['safety']
-                        ) if 'safety' in preferences else True
-        self._sync = bool(preferences['sync']
-                          ) if 'sync' in preferences else True
-        self._oos = bool(preferences['syncfix']
-                         ) if 'syncfix' in preferences else True
-        self._mp = bool(preferences['mission_pad']
-                        ) if 'mission_pad' in preferences else False
-        self._debug = bool(preferences['debug']
-                           ) if 'debug' in preferences else False
+        self._slock = Lock()
+        # Written to by set_ips()/set_ports() to wake the state thread out of waiting on the old socket
+        self._swake = socketpair()
+
+        # Bound methods cached for hot paths like remote_controller() that may be called many times a second
+        self._send_ = self._send
+        self._checkfly_ = self._checkfly
+
+        self._dd = int(preferences.get('default_distance', 50))
+        self._dr = int(preferences.get('default_rotation', 90))
+        self._spd = int(preferences.get('default_speed', 30))
+        self._sm = bool(preferences.get('safety', True))
+        self._sync = bool(preferences.get('sync', True))
+        self._oos = bool(preferences.get('syncfix', True))
+        self._mp = bool(preferences.get('mission_pad', False))
+        self._debug = bool(preferences.get('debug', False))
 
         if self._debug:
             print('[TELLO] Debug mode enabled')
 
         try:
             if '.' in self._ips[0]:
-                self._cserver, self._sserver = socket(
-                    AF_INET, SOCK_DGRAM), socket(AF_INET, SOCK_DGRAM)
+                self._cserver, self._sserver = _lowdelay(_sockbuf(socket(
+                    AF_INET, SOCK_DGRAM))), _sockbuf(socket(AF_INET, SOCK_DGRAM))
                 self._cserver.settimeout(self._to)
                 self._sserver.bind((ips[0], self._ports[1]))
                 self._sserver.settimeout(self._to)
@@ -165,8 +427,8 @@ class Tello:
                     print(
                         f'[TELLO] Set command socket to -> {ips[0]}:{ports[0]}\n[TELLO] Set state socket to -> {ips[0]}:{self._ports[1]}\n[TELLO] Timeout set to -> {self._to}')
             else:
-                self._cserver, self._sserver = socket(
-                    AF_INET6, SOCK_DGRAM), socket(AF_INET6, SOCK_DGRAM)
+                self._cserver, self._sserver = _lowdelay(_sockbuf(socket(
+                    AF_INET6, SOCK_DGRAM))), _sockbuf(socket(AF_INET6, SOCK_DGRAM))
                 self._cserver.settimeout(self._to)
                 self._sserver.bind((ips[0], self._ports[1]))
                 self._sserver.settimeout(self._to)
@@ -188,9 +450,9 @@ class Tello:
         self._send('speed', 'aval', False, self._spd)
         if self._mp:
             self._send('mon', 'basic')
-        if 'video' in preferences and preferences['video']:
+        if preferences.get('video'):
             self._send('streamon', 'basic')
-        if 'takeoff' in preferences and preferences['takeoff']:
+        if preferences.get('takeoff'):
             self._flying = True
             self._send('takeoff', 'basic')
         if self._debug:
@@ -228,20 +490,37 @@ class Tello:
                 'IPs provided are the same as the currently set ones')
 
         self._ips = ips
+        self._caddr = (ips[0], self._ports[0])
 
-        self._sevent.clear()
-
-        self._sserver.shutdown(SHUT_RDWR)
-        self._sserver = socket(AF_INET, SOCK_DGRAM)
-        self._sserver.bind((ips[0], self._ports[1]))
-        self._sserver.settimeout(self._to)
-
-        self._sevent.set()
+        self._rebind()
 
         if self._debug:
             print(
                 f'[TELLO] Set command socket to -> {ips[0]}:{self._ports[0]}\n[TELLO] Set state socket to -> {ips[0]}:{self._ports[1]}')
 
+    def _rebind(self) -> None:
+        '''
+        Internal method for replacing the state socket after the IPs or ports changed. The old socket is closed first so the new one can reuse its port. You normally wouldn't use this yourself
+        '''
+
+        self._sevent.clear()
+        self._swake[1].send(b'\0')
+
+        try:
+            # The state thread lets go of the lock as soon as it's woken, so this doesn't wait on a state packet or the timeout
+            with self._slock:
+                self._sserver.close()
+
+                try:
+                    self._sserver = _sockbuf(socket(AF_INET if '.' in self._ips[0] else AF_INET6, SOCK_DGRAM))
+                    self._sserver.bind((self._ips[0], self._ports[1]))
+                    self._sserver.settimeout(self._to)
+                except OSError:
+                    raise TelloError(
+                        'Unable to bind to provided IP/ports. Please make sure you are connected to your Tello drone')
+        finally:
+            self._sevent.set()
+
     def ports(self) -> tuple[int, int, int]:
         '''
         Returns the current ports the Tello socket's are sending to/receiving from
@@ -269,14 +548,9 @@ class Tello:
                 'Ports provided are the same as the currently set ones')
 
         self._ports = ports
-        self._sevent.clear()
+        self._caddr = (self._ips[0], ports[0])
 
-        self._sserver.shutdown(SHUT_RDWR)
-        self._sserver = socket(AF_INET, SOCK_DGRAM)
-        self._sserver.bind((self._ips[0], ports[1]))
-        self._sserver.settimeout(self._to)
-
-        self._sevent.set()
+        self._rebind()
 
         if self._debug:
             print(
@@ -533,305 +807,411 @@ class Tello:
         '''
 
         while self._running:
-            if self._cqueue.qsize():
-                req, call = self._cqueue.get()
+            # Blocks until a command is queued instead of polling. exit() queues (None, None, None) to wake it up
+            req, call, kind = self._cqueue.get()
+            if req is None:
+                return
+
+            # Commands are queued already encoded so this thread only has to send them
+            self._cserver.sendto(req, self._caddr)
+
+            try:
+                res = self._cserver.recv(1024).decode().lower()
+            except TimeoutError:
+                err = TelloError(
+                    f'Timed out. Did not receive response from drone within {self._to} second(s)')
+                if type(call) is Future:
+                    call.set_exception(err)
+                    self._cqueue.task_done()
+                    continue
+                raise err
+            except KeyboardInterrupt:
+                return
+
+            if res[:2] != 'ok' and not req.endswith(b'?'):
+                err = TelloError(f'Drone responded with error: {res}')
+                if type(call) is Future:
+                    call.set_exception(err)
+                    self._cqueue.task_done()
+                    continue
+                raise err
+            else:
+                if kind is _KIND_STREAMON:
+                    self._streaming = True
+                elif kind is _KIND_STREAMOFF:
+                    self._streaming = False
+                if self._debug:
+                    if kind is _KIND_WIFI:
+                        print(f'[TELLO] Set wifi successfully')
+                    else:
+                        print(
+                            f'[TELLO] Sent command \'{req.decode()}\' successfully')
 
-                self._cserver.sendto(
-                    req.encode(), (self._ips[0], self._ports[0]))
+            if type(call) is Future:
+                call.set_result(res)
+            elif call:
+                call(res)
+            self._cqueue.task_done()
 
+    def _rthread(self) -> None:
+        '''
+        Internal method for receiving state from the drone within a seperate thread. You normally wouldn't use this yourself
+        '''
+
+        while self._running:
+            self._sevent.wait()
+
+            # Held while the socket is in use so set_ips()/set_ports() can't close it under this thread
+            with self._slock:
                 try:
-                    res = self._cserver.recv(1024).decode().lower()
+                    # Waits on the wake socket too so set_ips()/set_ports() can get this thread off the old socket right away
+                    ready = select([self._sserver, self._swake[0]], [], [], self._to)[0]
+
+                    if self._swake[0] in ready:
+                        self._swake[0].recv(64)
+                        continue
+                    elif not ready:
+                        raise TimeoutError
+
+                    data = self._sserver.recv(1024)
+
+                    # Only the newest state matters, so packets that queued up while this thread was busy are skipped in one go.
+                    # Polled with select since a socket with a timeout waits out the timeout even for non-blocking reads
+                    while self._sevent.is_set() and select([self._sserver], [], [], 0)[0]:
+                        data = self._sserver.recv(1024)
                 except TimeoutError:
                     raise TelloError(
                         f'Timed out. Did not receive response from drone within {self._to} second(s)')
                 except KeyboardInterrupt:
                     return
 
-                if 'ok' not in res:
-                    raise TelloError(f'Drone responded with error: {res}')
-                else:
-                    if 'streamon' in req:
-                        self._streaming = True
-                    elif 'streamoff' in req:
-                        self._streaming = False
-                    if self._debug:
-                        if 'wifi' in req or req.startswith('ac'):
-                            print(f'[TELLO] Set wifi successfully')
-                        else:
-                            print(
-                                f'[TELLO] Sent command \'{req}\' successfully')
-
-                if call:
-                    call(res)
-                self._cqueue.task_done()
-        else:
-            return
+            # Packets look like 'pitch:0;roll:0;...;\r\n' so splitting is all the parsing they need.
+            # Keys are interned so the getters' literal keys match them by identity instead of comparing the strings
+            slist = {}
+            for m in data.decode().split(';'):
+                k, sep, v = m.partition(':')
+                if sep:
+                    slist[intern(k)] = v
 
-    def _rthread(self) -> None:
+            # Each packet is published as a new dict in a single store so getters reading several keys always see values from the same packet
+            self._slist = slist
+
+    def _send_async(self, msg: str) -> Future:
         '''
-        Internal method for receiving state from the drone within a seperate thread. You normally wouldn't use this yourself
+        Internal method for queueing a command without waiting on it. Returns a future that resolves with the drones response.
+        The drone tags its responses with no id, so they are matched to commands in the order the command thread sends them. You normally wouldn't use this yourself
         '''
 
-        while self._running:
-            self._sevent.wait()
+        fut = Future()
+        self._cqueue.put((msg.encode(), fut, _KIND_NORMAL))
+        return fut
 
-            try:
-                res = [m.split(':') for m in findall(
-                    r'[^;]+?(?=%)', self._sserver.recv(1024).decode().lower())]
-            except TimeoutError:
-                raise TelloError(
-                    f'Timed out. Did not receive response from drone within {self._to} second(s)')
-            except KeyboardInterrupt:
-                return
+    def _query(self, msg: str) -> str:
+        '''
+        Internal method for queueing a query and waiting up to the timeout for the drones response. You normally wouldn't use this yourself
+        '''
 
-            for match in res:
-                self._slist.update({match[0]: match[1]})
-        else:
+        try:
+            return self._send_async(msg).result(self._to)
+        except FutureTimeoutError:
+            raise TelloError(
+                f'Timed out. Did not receive response from drone within {self._to} second(s)')
+
+    def _sender(self, msg: str, kind: int = _KIND_NORMAL) -> None:
+        '''
+        Internal method for sending a command to the drone and waiting for its response. You normally wouldn't use this yourself
+        '''
+
+        if self._oos:
+            self._cqueue.join()
+
+        self._cserver.sendto(msg.encode(), self._caddr)
+
+        try:
+            res = self._cserver.recv(1024).decode().lower()
+        except TimeoutError:
+            raise TelloError(
+                f'Timed out. Did not receive response from drone within {self._to} second(s)')
+        except KeyboardInterrupt:
             return
 
-    def _send(self, msg: str, cmd_type: str, callback: Union[Callable, bool, None] = None, val: Union[int, list[Union[int, str, tuple[int, bool]]], list[Union[str, None]], str, None] = None) -> Union[None, 'Tello']:
+        if res[:2] != 'ok' and not msg.endswith('?'):
+            raise TelloError(f'Drone responded with error: {res}')
+        else:
+            if kind is _KIND_STREAMON:
+                self._streaming = True
+            elif kind is _KIND_STREAMOFF:
+                self._streaming = False
+            if self._debug:
+                if kind is _KIND_WIFI:
+                    print(f'[TELLO] Set wifi successfully')
+                else:
+                    print(f'[TELLO] Sent command \'{msg}\' successfully')
+
+    def _dispatch(self, command: str, callback: Union[Callable, bool, None], kind: int = _KIND_NORMAL) -> None:
         '''
-        Internal method for sending basic data synchronously to the drone. You normally wouldn't use this yourself
+        Internal method for queueing a formatted command, or sending it synchronously if callback is False. You normally wouldn't use this yourself
         '''
 
-        def sender(msg: str):
-            if self._oos:
-                self._cqueue.join()
+        if callback != False:
+            self._cqueue.put((command.encode(), callback, kind))
+        else:
+            self._sender(command, kind)
 
-            self._cserver.sendto(msg.encode(), (self._ips[0], self._ports[0]))
+    def _send_basic(self, msg: str, callback: Union[Callable, bool, None], val: None) -> None:
+        '''
+        Internal method for sending a command with no value. You normally wouldn't use this yourself
+        '''
 
-            try:
-                res = self._cserver.recv(1024).decode().lower()
-            except TimeoutError:
-                raise TelloError(
-                    f'Timed out. Did not receive response from drone within {self._to} second(s)')
-            except KeyboardInterrupt:
-                return
+        self._dispatch(msg, callback, _KINDS.get(msg, _KIND_NORMAL))
 
-            if 'ok' not in res:
-                raise TelloError(f'Drone responded with error: {res}')
-            else:
-                if 'streamon' in msg:
-                    self._streaming = True
-                elif 'streamoff' in msg:
-                    self._streaming = False
-                if self._debug:
-                    if 'wifi' in msg or msg.startswith('ac'):
-                        print(f'[TELLO] Set wifi successfully')
-                    else:
-                        print(f'[TELLO] Sent command \'{msg}\' successfully')
+    def _send_aval(self, msg: str, callback: Union[Callable, bool, None], val: Union[int, str]) -> None:
+        '''
+        Internal method for sending a command with an already validated value. You normally wouldn't use this yourself
+        '''
 
-        if cmd_type == 'basic':
-            self._cqueue.put(
-                (msg, callback)) if callback != False else sender(msg)
+        self._dispatch(f'{msg} {val}', callback)
 
-        elif cmd_type == 'aval':
-            self._cqueue.put((f'{msg} {val}', callback)) if callback != False else sender(
-                f'{msg} {val}')
+    def _send_dist(self, msg: str, callback: Union[Callable, bool, None], val: int) -> None:
+        '''
+        Internal method for sending a movement command, split into moves of at most 500cm. You normally wouldn't use this yourself
+        '''
 
-        elif cmd_type == 'dist':
-            if not type(val) is int or not 20 <= val:
-                raise ValueError(
-                    'Distance value is incorrect. Please make sure it\'s a valid integer and at least 20cm')
+        if type(val) is not int or not 20 <= val:
+            raise ValueError(
+                'Distance value is incorrect. Please make sure it\'s a valid integer and at least 20cm')
 
-            def disrun(val):
-                while val > 500:
-                    val -= 500
-                    yield 500
-                else:
-                    yield val
+        while val > 500:
+            val -= 500
+            self._dispatch(f'{msg} 500', callback)
+        self._dispatch(f'{msg} {val}', callback)
 
-            if callback != False:
-                for dist in disrun(val):
-                    self._cqueue.put((f'{msg} {dist}', callback))
-            else:
-                for dist in disrun(val):
-                    sender(f'{msg} {dist}')
+    def _send_rot(self, msg: str, callback: Union[Callable, bool, None], val: int) -> None:
+        '''
+        Internal method for sending a rotation command. You normally wouldn't use this yourself
+        '''
 
-        elif cmd_type == 'rot':
-            if not type(val) is int or not 1 <= val <= 360:
-                raise ValueError(
-                    'Rotational value is incorrect. Please make sure it\'s a valid integer and between 1 - 360deg')
+        if type(val) is not int or not 1 <= val <= 360:
+            raise ValueError(
+                'Rotational value is incorrect. Please make sure it\'s a valid integer and between 1 - 360deg')
 
-            self._cqueue.put((f'{msg} {val}', callback)) if callback != False else sender(
-                f'{msg} {val}')
+        self._dispatch(f'{msg} {val}', callback)
 
-        elif cmd_type == 'cord':
-            command: list[str] = []
+    def _send_cord(self, msg: str, callback: Union[Callable, bool, None], val: Union[list, tuple]) -> None:
+        '''
+        Internal method for sending a coordinate based command, with the speed last as a (speed, is curve) tuple. You normally wouldn't use this yourself
+        '''
 
-            command.append(msg)
+        # Should never happen
+        if not type(val) in (list, tuple):
+            raise ValueError()
 
-            # Should never happen
-            if not type(val) is list:
-                raise ValueError()
+        spd_idx = len(val)-1
 
-            for i, n in enumerate(val):
-                if i == len(val)-1:
-                    if type(n) is not tuple or (n[1] and not 10 <= n[0] <= 60):
-                        raise ValueError(
-                            'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 60cm/s')
-                    elif not 10 <= n[0] <= 100:
-                        raise ValueError(
-                            'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 100cm/s')
-                elif type(n) is not int or -500 <= n <= 500:
+        for i, n in enumerate(val):
+            if i == spd_idx:
+                if type(n) is not tuple or (n[1] and not 10 <= n[0] <= 60):
                     raise ValueError(
-                        'coordinate value is incorrect. Please make sure it\'s a valid integer between -500 - 500cm')
-
-                command.append(str(n))
+                        'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 60cm/s')
+                elif not 10 <= n[0] <= 100:
+                    raise ValueError(
+                        'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 100cm/s')
+            elif type(n) is not int or not -500 <= n <= 500:
+                raise ValueError(
+                    'coordinate value is incorrect. Please make sure it\'s a valid integer between -500 - 500cm')
 
-            self._cqueue.put((' '.join(command), callback)
-                             ) if callback != False else sender(' '.join(command))
+        # The speed is the only (speed, is curve) tuple so it's swapped for its value directly instead of checking every value
+        args = list(val)
+        args[spd_idx] = args[spd_idx][0]
+        command = _ARGS_FMT[len(args)] % (msg, *args)
 
-        elif cmd_type == 'mid':
-            command: list[str] = []
+        self._dispatch(command, callback)
 
-            command.append(msg)
+    def _send_mid(self, msg: str, callback: Union[Callable, bool, None], val: Union[list, tuple]) -> None:
+        '''
+        Internal method for sending a coordinate command relative to a mission pad. You normally wouldn't use this yourself
+        '''
 
-            # Should never happen
-            if not type(val) is list:
-                raise ValueError()
+        # Should never happen
+        if not type(val) in (list, tuple):
+            raise ValueError()
 
-            for i, n in enumerate(val):
-                leg = len(val)
+        leg = len(val)
+        spd_idx, mid_idx = leg-2, leg-1
 
-                if i == leg-2:
-                    if type(n) is not tuple or (n[1] and not 10 <= n[0] <= 60):
-                        raise ValueError(
-                            'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 60cm/s')
-                    elif not 10 <= n[0] <= 100:
-                        raise ValueError(
-                            'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 100cm/s')
-                elif i == leg-1 and (type(n) is not str or not match(r'^[m][1-8]$', n)):
+        for i, n in enumerate(val):
+            if i == spd_idx:
+                if type(n) is not tuple or (n[1] and not 10 <= n[0] <= 60):
                     raise ValueError(
-                        'Mission Pad value is incorrect. Please make sure it\'s a valid string and is between m1 - m8')
-                elif type(n) is not int or not -500 <= n <= 500:
+                        'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 60cm/s')
+                elif not 10 <= n[0] <= 100:
                     raise ValueError(
-                        'Coordinate value is incorrect. Please make sure it\'s a valid integer and between -500 - 500cm')
-
-                command.append(str(n))
+                        'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 100cm/s')
+            elif i == mid_idx:
+                if type(n) is not str or n not in _MPAD_IDS:
+                    raise ValueError(
+                        'Mission Pad value is incorrect. Please make sure it\'s a valid string and is between m1 - m8')
+            elif type(n) is not int or not -500 <= n <= 500:
+                raise ValueError(
+                    'Coordinate value is incorrect. Please make sure it\'s a valid integer and between -500 - 500cm')
 
-            self._cqueue.put((' '.join(command), callback)
-                             ) if callback != False else sender(' '.join(command))
+        args = list(val)
+        args[spd_idx] = args[spd_idx][0]
+        command = _ARGS_FMT[len(args)] % (msg, *args)
 
-        elif cmd_type == 'jump':
-            command: list[str] = []
+        self._dispatch(command, callback)
 
-            command.append(msg)
+    def _send_jump(self, msg: str, callback: Union[Callable, bool, None], val: Union[list, tuple]) -> None:
+        '''
+        Internal method for sending a jump command between two mission pads. You normally wouldn't use this yourself
+        '''
 
-            # Should never happen
-            if not type(val) is list:
-                raise ValueError()
+        # Should never happen
+        if not type(val) in (list, tuple):
+            raise ValueError()
 
-            for i, n in enumerate(val):
-                leg = len(val)
+        leg = len(val)
+        spd_idx, yaw_idx, mid_idx = leg-4, leg-3, leg-2
 
-                if i == leg-4:
-                    if type(n) is not tuple or (n[1] and not 10 <= n[0] <= 60):
-                        raise ValueError(
-                            'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 60cm/s')
-                    elif not 10 <= n[0] <= 100:
-                        raise ValueError(
-                            'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 100cm/s')
-                elif i == leg-3 and (type(n) is not int or not 1 <= n <= 360):
+        for i, n in enumerate(val):
+            if i == spd_idx:
+                if type(n) is not tuple or (n[1] and not 10 <= n[0] <= 60):
+                    raise ValueError(
+                        'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 60cm/s')
+                elif not 10 <= n[0] <= 100:
+                    raise ValueError(
+                        'Speed value is incorrect. Please make sure it\'s a valid integer between 10 - 100cm/s')
+            elif i == yaw_idx:
+                if type(n) is not int or not 1 <= n <= 360:
                     raise ValueError(
                         'Yaw value is incorrect. Please make sure it\'s a valid integer and between 1 - 360deg')
-                elif i == leg-1 or i == leg-2 and (type(n) is not str or not match(r'^[m][1-8]$', n)):
+            elif i >= mid_idx:
+                if type(n) is not str or n not in _MPAD_IDS:
                     raise ValueError(
                         'Mission Pad value is incorrect. Please make sure it\'s a valid string and is between m1 - m8')
-                elif type(n) is not int or not -500 <= n <= 500:
-                    raise ValueError(
-                        'coordinate value is incorrect. Please make sure it\'s a valid integer and between -500 - 500cm')
+            elif type(n) is not int or not -500 <= n <= 500:
+                raise ValueError(
+                    'coordinate value is incorrect. Please make sure it\'s a valid integer and between -500 - 500cm')
+
+        args = list(val)
+        args[spd_idx] = args[spd_idx][0]
+        command = _ARGS_FMT[len(args)] % (msg, *args)
 
-                command.append(str(n))
+        self._dispatch(command, callback)
 
-            self._cqueue.put((' '.join(command), callback)
-                             ) if callback != False else sender(' '.join(command))
+    def _send_setspd(self, msg: str, callback: Union[Callable, bool, None], val: int) -> None:
+        '''
+        Internal method for setting the drones speed, also kept as the default speed. You normally wouldn't use this yourself
+        '''
 
-        elif cmd_type == 'setspd':
-            if not type(val) is int or 10 <= val <= 60:
+        if type(val) is not int or not 10 <= val <= 60:
+            raise ValueError(
+                'Speed value is incorrect. Please make sure it\'s a valid integer and between 10 - 60cm/s')
+
+        self._spd = val
+
+        command = _SETSPD_FMT % (msg, val)
+
+        self._dispatch(command, callback)
+
+    def _send_setrc(self, msg: str, callback: Union[Callable, bool, None], val: Union[list, tuple]) -> None:
+        '''
+        Internal method for sending the remote controller stick values. You normally wouldn't use this yourself
+        '''
+
+        # Should never happen
+        if not type(val) in (list, tuple):
+            raise ValueError()
+
+        for n in val:
+            if type(n) is not int or not -100 <= n <= 100:
                 raise ValueError(
-                    'Speed value is incorrect. Please make sure it\'s a valid integer and between 10 - 60cm/s')
+                    'Joystick distance value is incorrect. Please make sure it\'s a valid integer and between -100 - 100')
 
-            self._spd = val
+        command = _ARGS_FMT[len(val)] % (msg, *val)
 
-            self._cqueue.put((f'{msg} {val}', callback)) if callback != False else sender(
-                f'{msg} {val}')
+        # Stick positions are absolute, so an rc command that's still queued is superseded by a newer one. Only done with no callback as each callback is owed its own response
+        if callback is None:
+            self._cqueue.put_latest((command.encode(), None, _KIND_NORMAL))
+        else:
+            self._dispatch(command, callback)
 
-        elif cmd_type == 'setrc':
-            command: list[str] = []
+    def _send_setwifi(self, msg: str, callback: Union[Callable, bool, None], val: tuple[str, str]) -> None:
+        '''
+        Internal method for setting the drones WiFi SSID and password, prompting for them if neither was provided. You normally wouldn't use this yourself
+        '''
 
-            command.append(msg)
+        ssid, pwd = val
 
-            # Should never happen
-            if not type(val) is list:
-                raise ValueError()
+        if not ssid and not pwd:
+            try:
+                ssid = input('Enter new WiFi SSID: ').strip()
+                pwd = getpass('Enter new WiFi password: ').strip()
+            except:
+                return
+        if not ssid or not ssid.isascii():
+            raise ValueError(
+                'WiFi SSID value is incorrect. Please make sure it\'s a valid string in ascii and at least 1 character')
+        elif not pwd or not len(pwd) >= 5 or not pwd.isascii():
+            raise ValueError(
+                'WiFi password value is incorrect. Please make sure it\'s a valid string in ascii and at least 5 characters')
+        elif not _WIFI_PWD.match(pwd):
+            raise ValueError(
+                'WiFi password value is insecure. Please make sure it contains at least 2 lowercase and uppercase letters and 1 number')
 
-            for n in val:
-                if not type(n) is int or -100 <= n <= 100:
-                    raise ValueError(
-                        'Joystick distance value is incorrect. Please make sure it\'s a valid integer and between -100 - 100')
+        command = _WIFI_FMT % (msg, ssid, pwd)
 
-                command.append(str(n))
+        self._dispatch(command, callback, _KIND_WIFI)
 
-            self._cqueue.put((' '.join(command), callback)
-                             ) if callback != False else sender(' '.join(command))
+    def _send_connwifi(self, msg: str, callback: Union[Callable, bool, None], val: tuple[str, str]) -> None:
+        '''
+        Internal method for connecting the drone to a WiFi network, prompting for it if neither the SSID nor the password was provided. You normally wouldn't use this yourself
+        '''
 
-        elif cmd_type == 'setwifi':
-            # Should never happen
-            if not type(val) is list or type(val[0]) is not str or type(val[1]) is not str:
-                raise ValueError()
+        ssid, pwd = val
 
-            if not val[0] and not val[1]:
-                try:
-                    val[0] = input('Enter new WiFi SSID: ').strip()
-                    val[1] = getpass('Enter new WiFi password: ').strip()
-                except:
-                    return
-            if len(val[0]) or not val[0].isascii():
-                raise ValueError(
-                    'WiFi SSID value is incorrect. Please make sure it\'s a valid string in ascii and at least 1 character')
-            elif not len(val[1]) >= 5 or not val[1].isascii():
-                raise ValueError(
-                    'WiFi password value is incorrect. Please make sure it\'s a valid string in ascii and at least 5 characters')
-            elif not match(r'(?=(?:[^a-z]*[a-z]){2})(?=(?:[^A-Z]*[A-Z]){2})(?=(?:[^0-9]*[0-9]){1})', val[1]):
-                raise ValueError(
-                    'WiFi password value is insecure. Please make sure it contains at least 2 lowercase and uppercase letters and 1 number')
+        if not ssid and not pwd:
+            try:
+                ssid = input('Enter WiFi SSID: ').strip()
+                pwd = getpass('Enter WiFi password: ').strip()
+            except:
+                return
 
-            self._cqueue.put((f'{msg} {val[0]} {val[1]}', callback)) if callback != False else sender(
-                f'{msg} {val[0]} {val[1]}')
+        if not ssid:
+            raise ValueError(
+                'WiFi SSID value is incorrect. Please make sure it\'s a valid string and at least 1 character')
+        elif not pwd:
+            raise ValueError(
+                'WiFi password value is incorrect. Please make sure it\'s a valid string and at least 1 character')
 
-        elif cmd_type == 'connwifi':
-            # Should never happen
-            if not type(val) is list or type(val[0]) is not str or type(val[1]) is not str:
-                raise ValueError()
+        command = _WIFI_FMT % (msg, ssid, pwd)
 
-            if not val[0] and not val[1]:
-                try:
-                    val[0] = input('Enter WiFi SSID: ').strip()
-                    val[1] = getpass('Enter WiFi password: ').strip()
-                except:
-                    return
+        self._dispatch(command, callback, _KIND_WIFI)
 
-            if not len(val[0]):
-                raise ValueError(
-                    'WiFi SSID value is incorrect. Please make sure it\'s a valid string and at least 1 character')
-            elif not len(val[1]):
-                raise ValueError(
-                    'WiFi password value is incorrect. Please make sure it\'s a valid string and at least 1 character')
+    def _send_mpad(self, msg: str, callback: Union[Callable, bool, None], val: int) -> None:
+        '''
+        Internal method for setting the mission pad detection direction. You normally wouldn't use this yourself
+        '''
+
+        if not self._mp:
+            raise ValueError(
+                'Mission pad detection hasn\'t been enabled yet. Please run the Tello.set_mission_pad() method first')
 
-            self._cqueue.put((f'{msg} {val[0]} {val[1]}', callback)) if callback != False else sender(
-                f'{msg} {val[0]} {val[1]}')
+        command = _MPAD_FMT % (msg, val)
 
-        elif cmd_type == 'mpad':
-            if not self._mp:
-                raise ValueError(
-                    'Mission pad detection hasn\'t been enabled yet. Please run the Tello.set_mission_pad() method first')
-            elif type(val) is not int or not 0 <= val <= 2:
-                raise ValueError(
-                    'Mission Pad Detection value is incorrect. Please make sure it\'s a valid integer and between 0 - 2')
+        self._dispatch(command, callback)
 
-            self._cqueue.put((f'{msg} {val}', callback)) if callback != False else sender(
-                f'{msg} {val}')
+    # Command type: handler table for _send, looked up once per command instead of walking an if/elif chain
+    _SENDERS = {'basic': _send_basic, 'aval': _send_aval, 'dist': _send_dist, 'rot': _send_rot, 'cord': _send_cord, 'mid': _send_mid,
+                'jump': _send_jump, 'setspd': _send_setspd, 'setrc': _send_setrc, 'setwifi': _send_setwifi, 'connwifi': _send_connwifi,
+                'mpad': _send_mpad}
+
+    def _send(self, msg: str, cmd_type: str, callback: Union[Callable, bool, None] = None, val: Union[int, tuple[Union[int, str, tuple[int, bool]], ...], list[Union[str, None]], str, None] = None) -> Union[None, 'Tello']:
+        '''
+        Internal method for sending data to the drone through the handler for its command type. You normally wouldn't use this yourself
+        '''
+
+        self._SENDERS[cmd_type](self, msg, callback, val)
 
         if callback:
             return self
@@ -841,24 +1221,37 @@ class Tello:
         Internal method for receiving a state value from the state dict. You normally wouldn't use this yourself
         '''
 
-        ret = []
+        # Taken once so every value comes from the same state packet
+        slist = self._slist
 
-        for key, val in self._slist.items():
-            if key in msgs:
-                ret.append(val)
+        try:
+            return tuple(slist[m] for m in msgs)
+        except KeyError as e:
+            raise _state_error(e.args[0])
 
-        if not len(ret):
-            raise TelloError(
-                'The status requested is only available when mission pads are enabled. Please run the Tello.set_mission_pad() method first to use this method')
+    def _state_one(self, msg: str) -> str:
+        '''
+        Internal method for receiving a single state value from the state dict without packing it into a tuple. You normally wouldn't use this yourself
+        '''
+
+        try:
+            return self._slist[msg]
+        except KeyError:
+            raise _state_error(msg)
+
+    def _input(self) -> tuple[str, ...]:
+        '''
+        Internal method for getting the ffmpeg input arguments for the drones video stream. You normally wouldn't use this yourself
+        '''
 
-        return tuple(ret)
+        return _stream_input(self._ips[1], self._ports[2], self._to)
 
     def _checkstream(self) -> None:
         '''
         Internal method to check whether the drone is streaming video or not. You normally wouldn't use this yourself
         '''
 
-        if which('ffmpeg') == None:
+        if not _has_ffmpeg():
             raise TelloError(
                 f'Can not stream video as ffmpeg is not installed')
 
@@ -875,7 +1268,7 @@ class Tello:
             raise TelloError(
                 f'Can only run this method once the drone is flying. Please run the Tello.takeoff() method first')
 
-    def takeoff(self, **preferences: Union[Callable, bool, None]) -> Union['Tello', None]:
+    def takeoff(self, *, callback: Union[Callable, bool, None] = False) -> Union['Tello', None]:
         '''
         Makes the drone automatically takeoff to a height of 80cm
 
@@ -888,9 +1281,9 @@ class Tello:
         if self._flying:
             raise TelloError('Already flying. Can\'t takeoff')
         self._flying = True
-        return self._send('takeoff', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('takeoff', 'basic', callback)
 
-    def land(self, **preferences:  Union[Callable, bool, None]) -> Union['Tello', None]:
+    def land(self, *, callback: Union[Callable, bool, None] = False) -> Union['Tello', None]:
         '''
         Makes the drone automatically land at it's current position
 
@@ -902,9 +1295,9 @@ class Tello:
 
         self._checkfly()
         self._flying = False
-        return self._send('land', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('land', 'basic', callback)
 
-    def emergency(self, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def emergency(self, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Stops all drone motors immediately in case of emergency
 
@@ -915,9 +1308,9 @@ class Tello:
         '''
 
         self._flying = False
-        return self._send('emergency', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('emergency', 'basic', callback)
 
-    def stop(self, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def stop(self, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone hover in the air at it's current position
 
@@ -928,9 +1321,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('stop', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('stop', 'basic', callback)
 
-    def up(self, distance: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def up(self, distance: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone move up the provided amount of centimeters. If distance isn't provided, the default amount of distance set will be used
 
@@ -944,9 +1337,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('up', 'dist', preferences['callback'] if 'callback' in preferences else False, distance if distance else self._dd)
+        return self._send('up', 'dist', callback, self._dd if distance is None else distance)
 
-    def down(self, distance: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def down(self, distance: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone move down the provided amount of centimeters. If distance isn't provided, the default amount of distance set will be used
 
@@ -960,9 +1353,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('down', 'dist', preferences['callback'] if 'callback' in preferences else False, distance if distance else self._dd)
+        return self._send('down', 'dist', callback, self._dd if distance is None else distance)
 
-    def left(self, distance: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def left(self, distance: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone move left the provided amount of centimeters. If distance isn't provided, the default amount of distance set will be used
 
@@ -976,9 +1369,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('left', 'dist', preferences['callback'] if 'callback' in preferences else False, distance if distance else self._dd)
+        return self._send('left', 'dist', callback, self._dd if distance is None else distance)
 
-    def right(self, distance: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def right(self, distance: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone move right the provided amount of centimeters. If distance isn't provided, the default amount of distance set will be used
 
@@ -992,9 +1385,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('right', 'dist', preferences['callback'] if 'callback' in preferences else False, distance if distance else self._dd)
+        return self._send('right', 'dist', callback, self._dd if distance is None else distance)
 
-    def forward(self, distance: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def forward(self, distance: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone move forward the provided amount of centimeters. If distance isn't provided, the default amount of distance set will be used
 
@@ -1008,9 +1401,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('forward', 'dist', preferences['callback'] if 'callback' in preferences else False, distance if distance else self._dd)
+        return self._send('forward', 'dist', callback, self._dd if distance is None else distance)
 
-    def backward(self, distance: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def backward(self, distance: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone move backward the provided amount of centimeters. If distance isn't provided, the default amount of distance set will be used
 
@@ -1024,9 +1417,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('back', 'dist', preferences['callback'] if 'callback' in preferences else False, distance if distance else self._dd)
+        return self._send('back', 'dist', callback, self._dd if distance is None else distance)
 
-    def clockwise(self, degrees: Union[int, None] = None, **preferences:  Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def clockwise(self, degrees: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone rotate clockwise the provided amount of degrees. If degrees isn't provided, the default amount of rotation set will be used
 
@@ -1040,9 +1433,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('cw', 'rot', preferences['callback'] if 'callback' in preferences else False, degrees if degrees else self._dr)
+        return self._send('cw', 'rot', callback, self._dr if degrees is None else degrees)
 
-    def counter_clockwise(self, degrees: Union[int, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def counter_clockwise(self, degrees: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone rotate counter-clockwise the provided amount of degrees.  If degrees isn't provided, the default amount of rotation set will be used
 
@@ -1056,9 +1449,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('ccw', 'rot', preferences['callback'] if 'callback' in preferences else False, degrees if degrees else self._dr)
+        return self._send('ccw', 'rot', callback, self._dr if degrees is None else degrees)
 
-    def flip_left(self, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def flip_left(self, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone flip towards the left
 
@@ -1069,9 +1462,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('flip', 'aval', preferences['callback'] if 'callback' in preferences else False, 'l')
+        return self._send('flip', 'aval', callback, 'l')
 
-    def flip_right(self, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def flip_right(self, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone flip towards the right
 
@@ -1082,9 +1475,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('flip', 'aval', preferences['callback'] if 'callback' in preferences else False, 'r')
+        return self._send('flip', 'aval', callback, 'r')
 
-    def flip_forward(self, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def flip_forward(self, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone flip forwards
 
@@ -1095,9 +1488,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('flip', 'aval', preferences['callback'] if 'callback' in preferences else False, 'f')
+        return self._send('flip', 'aval', callback, 'f')
 
-    def flip_backward(self, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def flip_backward(self, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone flip backwards
 
@@ -1108,9 +1501,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('flip', 'aval', preferences['callback'] if 'callback' in preferences else False, 'b')
+        return self._send('flip', 'aval', callback, 'b')
 
-    def go(self, x: int, y: int, z: int, speed: Union[int, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def go(self, x: int, y: int, z: int, speed: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone go to the provided coordinates based of it's current position (0, 0, 0). If speed isn't provided, the default amount of speed set will be used
 
@@ -1127,9 +1520,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('go', 'cord', preferences['callback'] if 'callback' in preferences else False, [x, y, z, (speed if speed else self._spd, False)])
+        return self._send('go', 'cord', callback, (x, y, z, (self._spd if speed is None else speed, False)))
 
-    def curve(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: Union[int, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def curve(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone fly in a curve according to the two provided coordinates based off it's current position (0, 0, 0). If speed isn't provided, the default amount of speed set will be used
 
@@ -1149,9 +1542,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('curve', 'cord', preferences['callback'] if 'callback' in preferences else False, [x1, y1, z1, x2, y2, z2, (speed if speed else self._spd, True)])
+        return self._send('curve', 'cord', callback, (x1, y1, z1, x2, y2, z2, (self._spd if speed is None else speed, True)))
 
-    def go_mid(self, x: int, y: int, z: int, mid: MISSION_PAD, speed: Union[int, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def go_mid(self, x: int, y: int, z: int, mid: MISSION_PAD, speed: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone go to the provided coordinates based off the provided mission pad. If speed isn't provided, the default amount of speed set will be used
 
@@ -1169,9 +1562,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('go', 'cord', preferences['callback'] if 'callback' in preferences else False, [x, y, z, mid, (speed if speed else self._spd, False)])
+        return self._send('go', 'mid', callback, (x, y, z, (self._spd if speed is None else speed, False), mid))
 
-    def curve_mid(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, mid: MISSION_PAD, speed: Union[int, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def curve_mid(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, mid: MISSION_PAD, speed: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone fly in a curve according to the two provided coordinates based off the provided mission pad. If speed isn't provided, the default amount of speed set will be used
 
@@ -1192,9 +1585,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('curve', 'cord', preferences['callback'] if 'callback' in preferences else False, [x1, y1, z1, x2, y2, z2, (speed if speed else self._spd, True), mid])
+        return self._send('curve', 'mid', callback, (x1, y1, z1, x2, y2, z2, (self._spd if speed is None else speed, True), mid))
 
-    def jump(self, x: int, y: int, z: int, mid1: MISSION_PAD, mid2: MISSION_PAD, yaw: int, speed: Union[int, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def jump(self, x: int, y: int, z: int, mid1: MISSION_PAD, mid2: MISSION_PAD, yaw: int, speed: Union[int, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Makes the drone go to the provided coordinates based off the first provided mission pad then rotate to the yaw value based off the z coordinate of the second mission pad. If speed isn't provided, the default amount of speed set will be used
 
@@ -1214,9 +1607,9 @@ class Tello:
         '''
 
         self._checkfly()
-        return self._send('jump', 'cord', preferences['callback'] if 'callback' in preferences else False, [x, y, z, (speed if speed else self._spd, False), yaw, mid1, mid2])
+        return self._send('jump', 'jump', callback, (x, y, z, (self._spd if speed is None else speed, False), yaw, mid1, mid2))
 
-    def remote_controller(self, lr: int, fb: int, ud: int, y: int, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def remote_controller(self, lr: int, fb: int, ud: int, y: int, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Moves the drone based off of simulating a remote controller. Each value provided is how far it will move from it's current position in that direction
 
@@ -1228,14 +1621,16 @@ class Tello:
 
         # Preferences
         - callback?: A function to be called once a response from the drone is received with said response as the first argument in string form.
-        If a None value is provided, this method will be non-blocking but will have no callback.
+        If a None value is provided, this method will be non-blocking but will have no callback. Consecutive non-blocking calls that haven't been sent yet
+        are replaced by the newest one, so a fast input loop never lags behind with stale stick positions.
         If False is provided, this method will be blocking and return the response (Defaults to False/blocking)
         '''
 
-        self._checkfly()
-        return self._send('rc', 'setrc', preferences['callback'] if 'callback' in preferences else False, [lr, fb, ud, y])
+        self._checkfly_()
+        return self._send_('rc', 'setrc', callback, (lr, fb, ud, y))
 
-    def set_wifi(self, ssid: Union[str, None] = None, pwd: Union[str, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    @validate(ssid=_WIFI, pwd=_WIFI)
+    def set_wifi(self, ssid: Union[str, None] = None, pwd: Union[str, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Sets the drones wifi SSID and password. Has a basic security check requiring 2 lowercase and 2 uppercase letters with 1 number.
         If no values are provided a terminal prompt will be used to collect them instead
@@ -1250,9 +1645,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response (Defaults to False/blocking)
         '''
 
-        return self._send('wifi', 'setwifi', preferences['callback'] if 'callback' in preferences else False, [ssid, pwd])
+        return self._send('wifi', 'setwifi', callback, (ssid, pwd))
 
-    def mission_pad_direction(self, dir: int, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    @validate(dir=_MPAD_DIR)
+    def mission_pad_direction(self, dir: int, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Sets the drones mission pad detection. Requires mission pad detection to be enabled
 
@@ -1265,9 +1661,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response (Defaults to False/blocking)
         '''
 
-        return self._send('mdirection', 'mpad', preferences['callback'] if 'callback' in preferences else False, dir)
+        return self._send('mdirection', 'mpad', callback, dir)
 
-    def connect_wifi(self, ssid: Union[str, None] = None, pwd: Union[str, None] = None, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    @validate(ssid=_WIFI, pwd=_WIFI)
+    def connect_wifi(self, ssid: Union[str, None] = None, pwd: Union[str, None] = None, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Turns the drone into station mode and connects to a new access point with the provided SSID and password.
         If no values are provided a terminal prompt will be used to collect them instead
@@ -1282,9 +1679,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response (Defaults to False/blocking)
         '''
 
-        return self._send('ac', 'connwifi', preferences['callback'] if 'callback' in preferences else False, [ssid, pwd])
+        return self._send('ac', 'connwifi', callback, (ssid, pwd))
 
-    def get_speed(self, **preferences: Union[Callable, bool]) -> Union[None, 'Tello']:
+    @validate(callback=_CALLBACK_BLOCKING)
+    def get_speed(self, *, callback: Union[Callable, bool] = False) -> Union[str, 'Tello']:
         '''
         Returns the current speed of the drone (in cm/s)
 
@@ -1293,13 +1691,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
-        if 'callback' in preferences and preferences['callback'] != False and not callable(preferences['callback']):
-            raise TypeError(
-                'Callback function is incorrect. Please make sure it\'s a callable')
+        return self._send('speed?', 'basic', callback) if callback else self._query('speed?')
 
-        return self._send('speed?', 'basic', preferences['callback'] if 'callback' in preferences else False)
-
-    def get_battery(self, **preferences: Union[Callable, bool]) -> Union[None, 'Tello']:
+    @validate(callback=_CALLBACK_BLOCKING)
+    def get_battery(self, *, callback: Union[Callable, bool] = False) -> Union[str, 'Tello']:
         '''
         Returns the current battery percentage of the drone
 
@@ -1308,9 +1703,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
-        return self._send('battery?', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('battery?', 'basic', callback) if callback else self._query('battery?')
 
-    def get_time(self, **preferences: Union[Callable, bool]) -> Union[None, 'Tello']:
+    @validate(callback=_CALLBACK_BLOCKING)
+    def get_time(self, *, callback: Union[Callable, bool] = False) -> Union[str, 'Tello']:
         '''
         Returns the current flight time of the drone
 
@@ -1319,9 +1715,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
-        return self._send('time?', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('time?', 'basic', callback) if callback else self._query('time?')
 
-    def get_signal_noise(self, **preferences: Union[Callable, bool]) -> Union[None, 'Tello']:
+    @validate(callback=_CALLBACK_BLOCKING)
+    def get_signal_noise(self, *, callback: Union[Callable, bool] = False) -> Union[str, 'Tello']:
         '''
         Returns the drones current WiFi SNR (signal:noise ratio)
 
@@ -1330,9 +1727,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
-        return self._send('wifi?', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('wifi?', 'basic', callback) if callback else self._query('wifi?')
 
-    def get_sdk(self, **preferences: Union[Callable, bool]) -> Union[None, 'Tello']:
+    @validate(callback=_CALLBACK_BLOCKING)
+    def get_sdk(self, *, callback: Union[Callable, bool] = False) -> Union[str, 'Tello']:
         '''
         Returns the current Tello SDK version of the drone
 
@@ -1341,9 +1739,10 @@ class Tello:
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
-        return self._send('sdk?', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('sdk?', 'basic', callback) if callback else self._query('sdk?')
 
-    def get_serial(self, **preferences: Union[Callable, bool]) -> Union[None, 'Tello']:
+    @validate(callback=_CALLBACK_BLOCKING)
+    def get_serial(self, *, callback: Union[Callable, bool] = False) -> Union[str, 'Tello']:
         '''
         Returns the serial number of the drone
 
@@ -1352,9 +1751,9 @@ class Tello:
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
-        return self._send('sn?', 'basic', preferences['callback'] if 'callback' in preferences else False)
+        return self._send('sn?', 'basic', callback) if callback else self._query('sn?')
 
-    def stream(self, on: bool = True, **preferences: Union[Callable, bool, None]) -> Union[None, 'Tello']:
+    def stream(self, on: bool = True, *, callback: Union[Callable, bool, None] = False) -> Union[None, 'Tello']:
         '''
         Enables/Disables the drones video stream
 
@@ -1367,8 +1766,6 @@ class Tello:
         If False is provided, this method will be blocking and return the response (Defaults to False/blocking)
         '''
 
-        callback = preferences['callback'] if 'callback' in preferences else False
-
         if on:
             return self._send('streamon', 'basic', callback)
         else:
@@ -1379,40 +1776,40 @@ class Tello:
         Returns the current mission pad ID of the one detected or None if not detected
         '''
 
-        res = self._state('mid')
-        return res[0] if not res[0] == -1 else None
+        res = self._state_one('mid')
+        return res if res != '-1' else None
 
     def get_mpxyz(self) -> Union[tuple[str], None]:
         '''
         Returns the current x, y, and z coordinates of the current detected mission pad or None if not detected
         '''
 
-        res = self._state('x', 'y', 'z')
-        return res if not 0 in res else None
+        mid, *res = self._state('mid', 'x', 'y', 'z')
+        return tuple(res) if mid != '-1' else None
 
     def get_mpx(self) -> Union[str, None]:
         '''
         Returns the current x coordinate of the current detected mission pad or None if not detected
         '''
 
-        res = self._state('x')
-        return res[0] if res[0] else None
+        mid, res = self._state('mid', 'x')
+        return res if mid != '-1' else None
 
     def get_mpy(self) -> Union[str, None]:
         '''
         Returns the current y coordinate of the current detected mission pad or None if not detected
         '''
 
-        res = self._state('y')
-        return res[0] if res[0] else None
+        mid, res = self._state('mid', 'y')
+        return res if mid != '-1' else None
 
     def get_mpz(self) -> Union[str, None]:
         '''
         Returns the current z coordinate of the current detected mission pad or None if not detected
         '''
 
-        res = self._state('z')
-        return res[0] if res[0] else None
+        mid, res = self._state('mid', 'z')
+        return res if mid != '-1' else None
 
     def get_pry(self) -> tuple[str]:
         '''
@@ -1426,21 +1823,21 @@ class Tello:
         Returns the current pitch of the drone (in degrees)
         '''
 
-        return self._state('pitch')[0]
+        return self._state_one('pitch')
 
     def get_roll(self) -> str:
         '''
         Returns the current roll of the drone (in degrees)
         '''
 
-        return self._state('roll')[0]
+        return self._state_one('roll')
 
     def get_yaw(self) -> str:
         '''
         Returns the current yaw of the drone (in degrees)
         '''
 
-        return self._state('yaw')[0]
+        return self._state_one('yaw')
 
     def get_xyzspd(self) -> tuple[str]:
         '''
@@ -1454,21 +1851,21 @@ class Tello:
         Returns the current speed on the x axis of the drone (in cm/s)
         '''
 
-        return self._state('vgx')[0]
+        return self._state_one('vgx')
 
     def get_yspd(self) -> str:
         '''
         Returns the current speed on the y axis of the drone (in cm/s)
         '''
 
-        return self._state('vgy')[0]
+        return self._state_one('vgy')
 
     def get_zspd(self) -> str:
         '''
         Returns the current speed on the z axis of the drone (in cm/s)
         '''
 
-        return self._state('vgz')[0]
+        return self._state_one('vgz')
 
     def get_temps(self) -> tuple[str]:
         '''
@@ -1482,35 +1879,35 @@ class Tello:
         Returns the lowest temprature the drone has experienced (in celsius)
         '''
 
-        return self._state('templ')[0]
+        return self._state_one('templ')
 
     def highest_temp(self) -> str:
         '''
         Returns the highest temprature the drone has experienced (in celsius)
         '''
 
-        return self._state('temph')[0]
+        return self._state_one('temph')
 
     def flight_length(self) -> str:
         '''
         Returns the distance the drone has flown in total (in cm)
         '''
 
-        return self._state('tof')[0]
+        return self._state_one('tof')
 
     def get_height(self) -> str:
         '''
         Returns the current height of the drone (in cm)
         '''
 
-        return self._state('h')[0]
+        return self._state_one('h')
 
     def get_pressure(self) -> str:
         '''
         Returns the current air pressure of the drone (in cm)
         '''
 
-        return self._state('baro')[0]
+        return self._state_one('baro')
 
     def get_axyz(self) -> tuple[str]:
         '''
@@ -1524,22 +1921,23 @@ class Tello:
         Returns the current acceleration on the x axis of the drone (in cm/s)
         '''
 
-        return self._state('agx')[0]
+        return self._state_one('agx')
 
     def get_ay(self) -> str:
         '''
         Returns the current acceleration on the y axis of the drone (in cm/s)
         '''
 
-        return self._state('agy')[0]
+        return self._state_one('agy')
 
     def get_az(self) -> str:
         '''
         Returns the current acceleration on the z axis of the drone (in cm/s)
         '''
 
-        return self._state('agz')[0]
+        return self._state_one('agz')
 
+    @validate(path=_PATH, resolution=_RESOLUTION, window=_WINDOW, callback=_CALLBACK_ANY)
     def photo(self, **preferences: Union[str, tuple[int], bool, Callable, None]) -> Union['Tello', str]:
         '''
         Takes a photo using the provided/default preferences.
@@ -1556,29 +1954,10 @@ class Tello:
 
         self._checkstream()
 
-        path = preferences['path'] if 'path' in preferences else './photos/'
-        resolution = preferences['resolution'] if 'resolution' in preferences else (
-            960, 720)
-        callback = preferences['callback'] if 'callback' in preferences else False
-        window = preferences['window'] if 'window' in preferences else False
-
-        if type(window) is not bool:
-            raise TypeError(
-                'Window preference provided was invalid. Please make sure it\'s a valid boolean type')
-        elif type(path) is not str or not (len(path) or match(r'([:](?=[\/]+))|(^[\.](?=[\/]+))|(^[\~](?=[\/]+))|(^[\/](?=\w+))', path)):
-            raise ValueError(
-                'Provided path was invalid. Please make sure it\'s a valid string and in proper path format')
-        elif type(resolution) is not tuple or (type(resolution[0]) is not int or type(resolution[1]) is not int or len(resolution) != 2):
-            raise ValueError(
-                'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
-        elif not (callback == False or None) and not callable(callback):
-            raise TypeError(
-                'Callback function is incorrect. Please make sure it\'s a callable')
-
-        for res in resolution:
-            if type(res) is not int:
-                raise TypeError(
-                    'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
+        path = preferences.get('path', './photos/')
+        resolution = preferences.get('resolution', self.HD)
+        callback = preferences.get('callback', False)
+        window = preferences.get('window', False)
 
         path = path.rsplit('/', 1)
         file = path[1] if '.' in path[1] else '{}.png'.format(
@@ -1587,18 +1966,14 @@ class Tello:
         path = f'{p}/{file}'
 
         if callback == False:
-            try:
-                mkdir(p)
-            except FileExistsError:
-                pass
+            makedirs(p, exist_ok=True)
 
             err = Popen([
                 'ffmpeg',
                 '-loglevel', 'quiet',
+                *_FFMPEG_LOWLAT,
                 '-y',
-                '-f', 'h264',
-                '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                    (self._to/3.2) * 1000000) if self._to else ''),
+                *self._input(),
                 '-pix_fmt', 'rgb24',
                 '-frames:v', '1',
                 '-vf', f'scale={resolution[0]}x{resolution[1]}',
@@ -1612,23 +1987,22 @@ class Tello:
             if self._debug:
                 print('[TELLO] Took a photo')
             if window:
+                # Imported here so drones that never show a photo don't pay for loading PIL
+                from PIL.Image import open as openimg
+
                 openimg(path).show(f'Tello - {file}')
 
             return path
         else:
             def thread():
-                try:
-                    mkdir(p)
-                except FileExistsError:
-                    pass
+                makedirs(p, exist_ok=True)
 
                 err = Popen([
                     'ffmpeg',
                     '-loglevel', 'quiet',
+                    *_FFMPEG_LOWLAT,
                     '-y',
-                    '-f', 'h264',
-                    '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                            self._to * 1000000) if self._to else ''),
+                    *self._input(),
                     '-pix_fmt', 'rgb24',
                     '-frames:v', '1',
                     '-vf', f'scale={resolution[0]}x{resolution[1]}',
@@ -1642,6 +2016,8 @@ class Tello:
                 if self._debug:
                     print('[TELLO] Took a photo')
                 if window:
+                    from PIL.Image import open as openimg
+
                     openimg(path).show(f'Tello - {file}')
                 if callback:
                     callback(path)
@@ -1651,12 +2027,14 @@ class Tello:
             Thread(target=thread).start()
             return self
 
-    def photo_bytes(self, **preferences: Union[tuple[int], Callable, bool]) -> Union[bytes, 'Tello']:
+    @validate(resolution=_RESOLUTION, format=_FORMAT, callback=_CALLBACK_BLOCKING)
+    def photo_bytes(self, **preferences: Union[tuple[int], str, Callable, bool]) -> Union[bytes, 'Tello']:
         '''
-        Returns the bytes of the photo taken in the provided/default resolution
+        Returns the bytes of the photo taken in the provided/default resolution and format
 
         # Preferences
         - resolution?: A tuple of the resolution you would like the photo to be in. Goes up to 1280 x 720 (Defaults to HD/720p)
+        - format?: The image format you would like the bytes to be in, either 'jpeg' or 'png' (Defaults to jpeg)
         - callback?: A function to be called once the image proccesing for the photo is complete with the bytes of said photo as the first argument.
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed
         (Defaults to False/blocking)
@@ -1664,110 +2042,69 @@ class Tello:
 
         self._checkstream()
 
-        resolution = preferences['resolution'] if 'resolution' in preferences else (
-            960, 720)
-        callback = preferences['callback'] if 'callback' in preferences else False
+        resolution = preferences.get('resolution', self.HD)
+        fmt = preferences.get('format', 'jpeg')
+        callback = preferences.get('callback', False)
 
-        if type(resolution) is not tuple or len(resolution) != 2:
-            raise ValueError(
-                'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
-        elif callback != False and not callable(callback):
-            raise TypeError(
-                'Callback function is incorrect. Please make sure it\'s a callable')
+        cmd = [
+            'ffmpeg',
+            '-loglevel', 'quiet',
+            *_FFMPEG_LOWLAT,
+            '-y',
+            *self._input(),
+            *(['-f', 'mjpeg', '-q:v', '2'] if fmt == 'jpeg' else ['-c:v', 'png', '-f', 'image2pipe']),
+            '-frames:v', '1'
+        ]
 
-        for res in resolution:
-            if type(res) is not int:
-                raise TypeError(
-                    'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
+        # The drone already streams in 720p so the scaler is only needed for other resolutions
+        if resolution != self.HD:
+            cmd += ['-vf', f'scale={resolution[0]}x{resolution[1]}']
 
-        if callback:
-            def thread():
-                proc = Popen([
-                    'ffmpeg',
-                    '-loglevel', 'quiet',
-                    '-y',
-                    '-f', 'h264',
-                    '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                        (self._to/3.2) * 1000000) if self._to else ''),
-                    '-f', 'image2',
-                    '-frames:v', '1',
-                    '-vf', f'scale={resolution[0]}x{resolution[1]}',
-                    '-'
-                ], stdout=PIPE, bufsize=10**8)
+        cmd.append('-')
 
-                if proc.wait():
-                    raise TelloError(
-                        f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
+        def capture() -> bytes:
+            # communicate() reads while waiting so a frame larger than the pipe buffer can't deadlock ffmpeg
+            proc = Popen(cmd, stdout=PIPE, bufsize=65536)
+            out = proc.communicate()[0]
 
-                callback(proc.communicate()[0])
+            if proc.returncode:
+                raise TelloError(
+                    f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
+
+            return out
+
+        if callback:
+            def thread():
+                callback(capture())
                 return
 
             Thread(target=thread).start()
             return self
         else:
-            proc = Popen([
-                'ffmpeg',
-                '-loglevel', 'quiet',
-                '-y',
-                '-f', 'h264',
-                '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                    (self._to/3.2) * 1000000) if self._to else ''),
-                '-f', 'image2',
-                '-frames:v', '1',
-                '-vf', f'scale={resolution[0]}x{resolution[1]}',
-                '-'
-            ], stdout=PIPE, bufsize=10**8)
-
-            if proc.wait():
-                raise TelloError(
-                    f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
-
-            return proc.communicate()[0]
+            return capture()
 
+    @validate(path=_PATH, resolution=_RESOLUTION, framerate=_FRAMERATE, window=_WINDOW, callback=_CALLBACK_ASYNC)
     def start_video(self, **preferences: Union[str, tuple[int], int, bool, Callable, None]) -> None:
         '''
         Takes a video using the provided/default parameters. If no path is provided, it automatically creates a videos folder in the current directory with the video having the current timestamp as the name and in mp4 format @ 960 x 720 (720p, 4:3) resolution
-        and in 60fps. Will not stop recording until the Tello.stop_video() method is run
+        and in the drones native framerate. If neither the resolution nor the framerate are changed the stream is saved as is without being re-encoded. Will not stop recording until the Tello.stop_video() method is run
 
         # Preferences
         - path?: A string path that can also include provided file name and format. For pure directories, it must have a trailing forward slash (Defaults to ./videos/TIMESTAMP.mp4)
         - resolution?: A tuple of the resolution you would like the video to be in. Goes up to 1280 x 720 (Defaults to HD/720p)
-        - framerate?: An integer of the framerate you would like the video to be in. Goes up to 60fps (Defaults to 60fps)
-        - window?: Enable/Disable a live preview window while the video is being taken. If enabled a web folder will be created for the livestream and will be deleted at the end (Defaults to False/disabled)
+        - framerate?: An integer of the framerate you would like the video to be in. Goes up to 60fps (Defaults to the drones native framerate)
+        - window?: Enable/Disable a live preview window while the video is being taken. If enabled a temporary folder will be created for the livestream (in memory where supported) and will be deleted at the end (Defaults to False/disabled)
         - callback?: A function to be called once the Tello.stop_video() method is called with the absolute path to said video as the first argument.
         Does not accept False since the video recorder always runs in a seperate thread (Defaults to None)
         '''
 
         self._checkstream()
 
-        path = preferences['path'] if 'path' in preferences else './videos/'
-        resolution = preferences['resolution'] if 'resolution' in preferences else (
-            960, 720)
-        framerate = preferences['framerate'] if 'framerate' in preferences else 60
-        callback = preferences['callback'] if 'callback' in preferences else None
-        window = preferences['window'] if 'window' in preferences else False
-        rb = resolution[0] * resolution[1] * 3
-
-        if not type(path) is str or not len(path) or not match(r'([:](?=[\/]+))|(^[\.](?=[\/]+))|(^[\~](?=[\/]+))|(^[\/](?=\w+))', path):
-            raise ValueError(
-                'Provided path was invalid. Please make sure it\'s a valid string and in proper path format')
-        elif not type(resolution) is tuple or not len(resolution) == 2:
-            raise ValueError(
-                'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
-        elif not type(framerate) is int or not 10 <= framerate <= 60:
-            raise ValueError(
-                'Provided framerate was invalid. Please make sure it\'s a valid integer and inbetween 10 - 60')
-        elif not type(window) is bool:
-            raise TypeError(
-                'Window value provided was invalid. Please make sure it\'s a valid boolean type')
-        elif callback != None and not callable(callback):
-            raise TypeError(
-                'Callback function is incorrect. Please make sure it\'s a callable')
-
-        for res in resolution:
-            if type(res) is not int:
-                raise TypeError(
-                    'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
+        path = preferences.get('path', './videos/')
+        resolution = preferences.get('resolution', self.HD)
+        framerate = preferences.get('framerate', 60)
+        callback = preferences.get('callback', None)
+        window = preferences.get('window', False)
 
         if window and self._web:
             raise TelloError(
@@ -1779,188 +2116,166 @@ class Tello:
         p = str(abspath(path[0]))
         path = f'{p}/{file}'
 
-        self._rec = True
+        makedirs(p, exist_ok=True)
 
-        try:
-            mkdir(p)
-        except FileExistsError:
-            pass
+        if resolution == self.HD and 'framerate' not in preferences:
+            # The drone already streams 720p H.264 so it can be muxed straight into the file without decoding
+            codec = ['-c', 'copy']
+        else:
+            # The tee muxer can't pick an encoder on its own. The preview uses the same low latency settings as Tello.live()
+            encoder = _FFMPEG_ZEROLAT if window else ['-c:v', 'libx264']
+            codec = ['-vf', f'scale={resolution[0]}x{resolution[1]},fps={framerate}', *encoder, '-pix_fmt', 'yuv420p']
+
+        if window:
+            # The webserver modules are only imported by the methods that use them to keep importing the library fast
+            from webbrowser import open as openweb
+            from .tello_web import _TelloWebRecServer
+
+            # Kept on tmpfs where available so the preview segments never touch the disk
+            webdir = mkdtemp(prefix='tello_', dir='/dev/shm' if isdir('/dev/shm') else None)
+
+            self._web = _TelloWebRecServer(_WEB_ADDR, webdir)
+            Thread(target=self._web.serve_forever, daemon=True).start()
+
+            # Encode once and let ffmpeg's tee muxer write both the recording and the HLS preview
+            out = ['-map', '0:v', '-f', 'tee',
+                   f'{path}|[f=hls:hls_time=0:hls_flags=delete_segments:hls_list_size=1]{webdir}/play.m3u8']
+        else:
+            out = [path]
 
         proc = Popen([
             'ffmpeg',
             '-loglevel', 'quiet',
+            *_FFMPEG_LOWLAT,
             '-y',
-            '-f', 'h264',
-            '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                (self._to/3.2) * 1000000) if self._to else ''),
-            '-f', 'rawvideo',
-            '-pix_fmt', 'rgb24',
-            '-vf', f'scale={resolution[0]}x{resolution[1]}, fps={str(framerate)}',
-            '-'
-        ], stdout=PIPE, bufsize=10**8)
-
-        sleep(self._to)
-        if proc.poll():
+            *_FFMPEG_THREADS,
+            *self._input(),
+            *codec,
+            *out,
+            '-progress', 'pipe:1'
+        ], stdout=PIPE)
+
+        # ffmpeg only starts writing progress reports once the stream is flowing, so the first one doubles as a ready signal
+        if not _ready(proc.stdout, self._to) or not proc.stdout.read1():
+            proc.kill()
+            if window:
+                self._web.shutdown()
+                self._web = None
+                rmtree(webdir)
             raise TelloError(
                 f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
 
-        rec = Popen([
-            'ffmpeg',
-            '-loglevel', 'quiet',
-            '-y',
-            '-pix_fmt', 'rgb24',
-            '-s', f'{resolution[0]}x{resolution[1]}',
-            '-f', 'rawvideo',
-            '-i', '-',
-            '-pix_fmt', 'yuv420p',
-            path
-        ], stdin=PIPE)
-
-        if window:
-            try:
-                mkdir('./web')
-            except:
-                pass
-
-            open('./web/play.m3u8', 'w').close()
+        self._rec = True
 
-            hls = Popen([
-                'ffmpeg',
-                '-y',
-                '-loglevel', 'quiet',
-                '-pix_fmt', 'rgb24',
-                '-s', f'{resolution[0]}x{resolution[1]}',
-                '-f', 'rawvideo',
-                '-i', '-',
-                '-pix_fmt', 'yuv420p',
-                '-hls_time', '0',
-                '-hls_flags', 'delete_segments',
-                '-hls_list_size', '1',
-                './web/play.m3u8'
-            ], stdin=PIPE)
+        def thread():
+            if self._debug:
+                print('[TELLO] Starting recording')
 
-            def thread():
-                f = proc.stdout.read(rb)
-                rec.stdin.write(f)
-                hls.stdin.write(f)
-                if self._debug:
-                    print('[TELLO] Starting recording')
+            try:
+                if window:
+                    openweb(self.get_web_url(), new=2)
 
-                openweb('http://127.0.0.1', new=2)
+                # Draining the progress reports keeps ffmpeg from blocking on a full pipe and wakes this loop up regularly
+                while self._rec and self._running and proc.stdout.read1():
+                    pass
+            finally:
+                # Finalizing a re-encoded file can take a while so there's no timeout here
+                _stop(proc, None)
 
-                while self._rec and self._running:
-                    f = proc.stdout.read(rb)
-                    rec.stdin.write(f)
-                    hls.stdin.write(f)
-                else:
-                    rec.communicate()
-                    hls.communicate()
-                    proc.send_signal(2)
+                if window:
                     self._web.shutdown()
                     self._web = None
 
-                    rmtree('./web')
-
-                    if self._debug:
-                        print('[TELLO] Recording finished')
-                    if callback:
-                        callback(path)
-                    return
-
-            self._web = HTTPServer(('', 80), _TelloWebRec)
-
-            Thread(target=thread).start()
-            Thread(target=self._web.serve_forever, daemon=True).start()
-        else:
-            def thread():
-                rec.stdin.write(proc.stdout.read(rb))
-
-                if self._debug:
-                    print('[TELLO] Starting recording')
-                while self._rec and self._running:
-                    rec.stdin.write(proc.stdout.read(rb))
-                else:
-                    rec.communicate()
-                    proc.send_signal(2)
+                    rmtree(webdir)
 
-                    if self._debug:
-                        print('[TELLO] Recording finished')
-                    if callback:
-                        callback(path)
-                    return
+            if self._debug:
+                print('[TELLO] Recording finished')
+            if callback:
+                callback(path)
 
-            Thread(target=thread).start()
+        Thread(target=thread).start()
 
-    def video_bytes(self, **preferences: Union[tuple[int], int, bool, Callable]) -> Union[list[bytes], 'Tello']:
+    @validate(resolution=_RESOLUTION, frames=_FRAMES, realtime=_REALTIME, hwaccel=_HWACCEL, batch=_BATCH, callback=_CALLBACK_BLOCKING)
+    def video_bytes(self, **preferences: Union[tuple[int], int, bool, str, Callable, None]) -> Union[list[memoryview], 'Tello']:
         '''
-        Returns a list of each video frame with the bytes of said frame being taken in the provided/default resolution. Will not stop appending frames until the provided max frames is met or the Tello.stop_frames() method is run
+        Returns a list of each video frame with the bytes of said frame being taken in the provided/default resolution. Will not stop appending frames until the provided max frames is met or the Tello.stop_frames() method is run.
+        Frames are read into large preallocated buffers and each frame is returned as a memoryview of one instead of its own bytes object
 
         # Preferences
         - resolution?: A tuple of the resolution you would like the video to be in. Goes up to 1280 x 720 (Defaults to HD/720p)
         - frames?: The max amount of frames you would like to be generated (Defaults to 0/unlimited)
+        - realtime?: Enable/Disable giving the frame collecting thread realtime priority on its own cpu to reduce dropped frames. Only applies when a callback is provided and is Linux only,
+        requiring the needed permissions (Defaults to False/Disabled)
+        - hwaccel?: The ffmpeg hardware acceleration method to decode the drones stream with, such as 'cuda' or 'vaapi'. Frames are still returned in rgb24 (Defaults to None/CPU decoding)
+        - batch?: The amount of frames to collect before each call to the callback, so only one batch is held in memory at a time. Only applies when a callback is provided (Defaults to 0/a single call at the end)
         - callback?: A function to be called once the max amount of frames is reached or the Tello.stop_frames() method is run with the bytes of said video frames as the first argument.
         If False is provided, this method will be blocking and return the response. Does not accept None since the return value of this function is needed (Defaults to False/blocking)
         '''
 
         self._checkstream()
 
-        frames = preferences['frames'] if 'frames' in preferences else 0
-        resolution = preferences['resolution'] if 'resolution' in preferences else (
-            960, 720)
-        callback = preferences['callback'] if 'callback' in preferences else False
+        frames = preferences.get('frames', 0)
+        batch = preferences.get('batch', 0)
+        resolution = preferences.get('resolution', self.HD)
+        callback = preferences.get('callback', False)
+        realtime = preferences.get('realtime', False)
+        hwaccel = preferences.get('hwaccel', None)
         rb = resolution[0] * resolution[1] * 3
 
-        if type(resolution) is not tuple or len(resolution) != 2:
-            raise ValueError(
-                'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
-        elif type(frames) is not int:
-            raise TypeError(
-                'Provided frame count was invalid. Please make sure it\'s a valid integer')
-        elif callback != False and not callable(callback):
-            raise TypeError(
-                'Callback function is incorrect. Please make sure it\'s a callable')
-
-        for res in resolution:
-            if type(res) is not int:
-                raise TypeError(
-                    'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
-
-        ret = []
+        # Decoded frames are downloaded back from the GPU since they're handed out as rgb24
+        accel = ['-hwaccel', hwaccel] if hwaccel else []
 
         if callback:
             def thread():
+                if realtime:
+                    _realtime()
+
                 proc = Popen([
                     'ffmpeg',
                     '-loglevel', 'quiet',
+                    *_FFMPEG_LOWLAT,
                     '-y',
-                    '-f', 'h264',
-                    '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                        (self._to/3.2) * 1000000) if self._to else ''),
+                    *accel,
+                    *_FFMPEG_THREADS,
+                    *self._input(),
                     '-f', 'rawvideo',
+                    '-flush_packets', '1',
                     '-pix_fmt', 'rgb24',
-                    '-vf', f'scale={resolution[0]}x{resolution[1]}'
+                    '-vf', f'scale={resolution[0]}x{resolution[1]}',
                     '-'
-                ], stdout=PIPE, bufsize=10**8)
+                ], stdout=PIPE, bufsize=0)
+                _growpipe(proc.stdout, _PIPE_FRAMES * rb)
 
-                sleep(self._to)
-                if proc.poll():
+                # Wait for the first frame bytes instead of a fixed sleep. ffmpeg exiting early wakes this up too
+                if not _ready(proc.stdout, self._to) or proc.poll():
+                    proc.kill()
                     raise TelloError(
                         f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
 
-                if frames:
-                    for _ in range(frames):
-                        ret.append(proc.stdout.read(rb))
-                    else:
-                        proc.send_signal(2)
-                else:
-                    self._frames = True
-                    while self._frames and self._running:
-                        ret.append(proc.stdout.read(rb))
-                    else:
-                        proc.send_signal(2)
+                self._frames = True
+
+                if batch:
+                    total = 0
+                    try:
+                        while self._frames and self._running and (not frames or total < frames):
+                            count = min(batch, frames - total) if frames else batch
+                            ret = _readframes(proc.stdout, rb, count, None)
+                            total += len(ret)
+
+                            if ret:
+                                callback(ret)
+                            if len(ret) < count:
+                                break
+                    finally:
+                        _stop(proc)
+                    return
+
+                try:
+                    ret = _readframes(proc.stdout, rb, frames, lambda: self._frames and self._running)
+                finally:
+                    _stop(proc)
 
                 callback(ret)
-                return
 
             Thread(target=thread).start()
             return self
@@ -1968,128 +2283,111 @@ class Tello:
             proc = Popen([
                 'ffmpeg',
                 '-loglevel', 'quiet',
+                *_FFMPEG_LOWLAT,
                 '-y',
-                '-f', 'h264',
-                '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                    (self._to/3.2) * 1000000) if self._to else ''),
+                *accel,
+                *_FFMPEG_THREADS,
+                *self._input(),
                 '-f', 'rawvideo',
+                '-flush_packets', '1',
                 '-pix_fmt', 'rgb24',
                 '-vf', f'scale={resolution[0]}x{resolution[1]}',
                 '-'
-            ], stdout=PIPE, bufsize=10**8)
+            ], stdout=PIPE, bufsize=0)
+            _growpipe(proc.stdout, _PIPE_FRAMES * rb)
 
-            sleep(self._to)
-            if proc.poll():
+            # Wait for the first frame bytes instead of a fixed sleep. ffmpeg exiting early wakes this up too
+            if not _ready(proc.stdout, self._to) or proc.poll():
+                proc.kill()
                 raise TelloError(
                     f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
 
-            if frames:
-                for _ in range(frames):
-                    ret.append(proc.stdout.read(rb))
-                else:
-                    proc.send_signal(2)
-            else:
-                self._frames = True
-                while self._frames and self._running:
-                    ret.append(proc.stdout.read(rb))
-                else:
-                    proc.send_signal(2)
+            self._frames = True
+            try:
+                ret = _readframes(proc.stdout, rb, frames, lambda: self._frames and self._running)
+            finally:
+                _stop(proc)
 
             return ret
 
+    @validate(resolution=_RESOLUTION, framerate=_FRAMERATE)
     def live(self, **preferences: Union[tuple[int], int]) -> None:
         '''
-        Displays a live feed of the drone video inside a browser window in the provided/default resolution and framerate. Will not shut down the webserver until the Tello.stop_live() method is run
+        Displays a live feed of the drone video inside a browser window in the provided/default resolution and framerate. If neither the resolution nor the framerate are changed the stream is served as is without being re-encoded.
+        Will not shut down the webserver until the Tello.stop_live() method is run
 
         # Parameters
         - resolution?: A tuple of the resolution you would like the video to be in. Goes up to 1280 x 720 (Defaults to HD/720p)
-        - framerate?: An integer of the framerate you would like the video to be in. Goes up to 60fps (Defaults to 60fps)
+        - framerate?: An integer of the framerate you would like the video to be in. Goes up to 60fps (Defaults to the drones native framerate)
         '''
 
         self._checkstream()
 
-        resolution = preferences['resolution'] if 'resolution' in preferences else (
-            960, 720)
-        framerate = preferences['framerate'] if 'framerate' in preferences else 60
-        rb = resolution[0] * resolution[1] * 3
-
-        if type(resolution) is not tuple or len(resolution) != 2:
-            raise ValueError(
-                'Provided resolution was invalid. Please make sure it\'s a valid tuple with 2 integers providing the width and height of the resolution')
-        elif type(framerate) is not int or not 10 <= framerate <= 60:
-            raise ValueError(
-                'Provided framerate was invalid. Please make sure it\'s a valid integer and inbetween 10 - 60')
+        resolution = preferences.get('resolution', self.HD)
+        framerate = preferences.get('framerate', 60)
 
         if self._web:
             raise TelloError(
                 'Webserver on video method already created. Please run the Tello.stop_video() method first')
 
-        self._live = True
+        if resolution == self.HD and 'framerate' not in preferences:
+            codec = ['-c:v', 'copy']
+        else:
+            codec = ['-vf', f'scale={resolution[0]}x{resolution[1]},fps={framerate}', *_FFMPEG_ZEROLAT, '-pix_fmt', 'yuv420p']
 
-        proc = Popen([
-            'ffmpeg',
-            '-loglevel', 'quiet',
-            '-y',
-            '-f', 'h264',
-            '-i', 'udp://{}:{}{}'.format(self._ips[1], self._ports[2], '?timeout={}'.format(
-                (self._to/3.2) * 1000000) if self._to else ''),
-            '-f', 'rawvideo',
-            '-pix_fmt', 'rgb24',
-            '-vf', f'scale={resolution[0]}x{resolution[1]}, fps={str(framerate)}'
-            '-'
-        ], stdout=PIPE, bufsize=10**8)
-
-        if proc.poll():
-            raise TelloError(
-                f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
+        from webbrowser import open as openweb
+        from .tello_web import _TelloWebLiveServer
 
-        try:
-            mkdir('./web')
-        except:
-            pass
+        # ffmpeg uploads the playlist and segments straight to the webserver, which keeps them in memory instead of on disk
+        self._web = _TelloWebLiveServer(_WEB_ADDR)
+        Thread(target=self._web.serve_forever, daemon=True).start()
 
-        open('./web/play.m3u8', 'w').close()
+        url = self.get_web_url()
 
-        hls = Popen([
+        # A single ffmpeg goes straight from the drones stream to HLS so no frames pass through Python
+        proc = Popen([
             'ffmpeg',
-            '-y',
             '-loglevel', 'quiet',
-            '-pix_fmt', 'rgb24',
-            '-s', f'{resolution[0]}x{resolution[1]}',
-            '-f', 'rawvideo',
-            '-i', '-',
-            '-pix_fmt', 'yuv420p',
+            '-progress', 'pipe:1',
+            *_FFMPEG_LOWLAT,
+            '-y',
+            *self._input(),
+            *codec,
+            '-f', 'hls',
             '-hls_time', '0',
-            '-hls_flags', 'delete_segments',
+            '-hls_flags', 'delete_segments+independent_segments',
             '-hls_list_size', '1',
-            './web/play.m3u8'
-        ], stdin=PIPE)
+            '-method', 'PUT',
+            f'{url}/play.m3u8'
+        ], stdout=PIPE)
+
+        if not _ready(proc.stdout, self._to) or not proc.stdout.read1():
+            proc.kill()
+            self._web.shutdown()
+            self._web = None
+            raise TelloError(
+                f'Video server timed out. Did not receive stream from drone within {self._to} second(s)')
+
+        self._live = True
 
         def thread():
-            hls.stdin.write(proc.stdout.read(rb))
             if self._debug:
                 print('[TELLO] Starting live session')
 
-            openweb('http://127.0.0.1', new=2)
+            openweb(url, new=2)
 
-            while self._live and self._running:
-                hls.stdin.write(proc.stdout.read(rb))
-            else:
-                hls.communicate()
-                proc.send_signal(2)
+            try:
+                while self._live and self._running and proc.stdout.read1():
+                    pass
+            finally:
+                _stop(proc)
                 self._web.shutdown()
                 self._web = None
 
-                rmtree('./web')
-
-                if self._debug:
-                    print('[TELLO] Live session ended')
-                return
-
-        self._web = HTTPServer(('', 80), _TelloWebLive)
+            if self._debug:
+                print('[TELLO] Live session ended')
 
         Thread(target=thread).start()
-        Thread(target=self._web.serve_forever, daemon=True).start()
 
     def stop_video(self) -> None:
         '''
@@ -2105,6 +2403,14 @@ class Tello:
 
         self._frames = False
 
+    def get_web_url(self) -> Union[str, None]:
+        '''
+        Returns the URL of the webserver started by the Tello.live() method or the Tello.start_video() method window preference, or None if neither is running
+        '''
+
+        web = self._web
+        return f'http://{_WEB_ADDR[0]}:{web.server_address[1]}' if web else None
+
     def stop_live(self) -> None:
         '''
         Shuts down the Tello.live() method webserver
@@ -2127,3 +2433,4 @@ class Tello:
             self._cqueue.join()
 
         self._running = False
+        self._cqueue.put((None, None, None))
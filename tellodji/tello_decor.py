@@ -6,6 +6,8 @@ Made by zahtec (https://www.github.com/zahtec)
 
 from typing import Callable, get_origin, get_args, Union
 from inspect import getmembers, getfullargspec
+from itertools import chain
+from functools import wraps
 from .tello_error import TelloError
 
 def check_typing(func, args, kwargs):
@@ -83,3 +85,25 @@ def tello_decor(cls):
         if '__' not in m[0]: setattr(cls, m[0], decor(m[1]))
 
     return cls
+
+def validate(**spec):
+    '''
+    Method decorator for validating arguments and preferences before the method runs. Each keyword maps an argument name to a
+    (check, error type, error message) tuple. Only values that were actually passed are checked as defaults are assumed to be valid
+    '''
+
+    def decor(func):
+        names = getfullargspec(func).args[1:]
+
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            for name, val in chain(zip(names, args), kwargs.items()):
+                if name in spec:
+                    check, err, msg = spec[name]
+                    if not check(val): raise err(msg)
+
+            return func(self, *args, **kwargs)
+
+        return inner
+
+    return decor
@@ -0,0 +1,65 @@
+'''
+Module for holding the Tello command queue class
+Made by zahtec (https://www.github.com/zahtec/tellodji)
+'''
+
+from collections import deque
+from threading import Condition
+from typing import Any
+
+class _TelloQueue:
+    '''
+    Internal class for the command queue. A deque guarded by a single condition, as the one producer/one consumer command stream
+    doesn't need queue.Queue's three conditions and size bookkeeping. Has the same put/get/task_done/join interface. You normally wouldn't use this yourself
+    '''
+
+    __slots__ = ('_items', '_cond', '_pending', '_latest')
+
+    def __init__(self) -> None:
+        self._items = deque()
+        self._cond = Condition()
+        self._pending = 0
+        # Whether the last queued item was put with put_latest() and can still be replaced
+        self._latest = False
+
+    def put(self, item: Any) -> None:
+        with self._cond:
+            self._items.append(item)
+            self._pending += 1
+            self._latest = False
+            # join() waits on the same condition, so everyone is woken to recheck
+            self._cond.notify_all()
+
+    def put_latest(self, item: Any) -> None:
+        '''
+        Queues an item where only the newest one matters. If the last queued item was also put this way and hasn't been taken yet, it's replaced instead
+        '''
+
+        with self._cond:
+            if self._latest:
+                self._items[-1] = item
+                return
+
+            self._items.append(item)
+            self._pending += 1
+            self._latest = True
+            self._cond.notify_all()
+
+    def get(self) -> Any:
+        with self._cond:
+            while not self._items:
+                self._cond.wait()
+            if len(self._items) == 1:
+                self._latest = False
+            return self._items.popleft()
+
+    def task_done(self) -> None:
+        with self._cond:
+            self._pending -= 1
+            if not self._pending:
+                self._cond.notify_all()
+
+    def join(self) -> None:
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
@@ -3,12 +3,23 @@ Module for holding the Tello webserver classes
 Made by zahtec (https://www.github.com/zahtec/tellodji)
 '''
 
-from http.server import BaseHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from os.path import dirname
 
+class _TelloWebRecServer(ThreadingHTTPServer):
+    '''
+    Internal class for the start_video() webserver. Holds the directory ffmpeg writes the HLS preview into. You normally wouldn't use this yourself
+    '''
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], directory: str) -> None:
+        super().__init__(address, _TelloWebRec)
+        self.directory = directory
+
 class _TelloWebRec(BaseHTTPRequestHandler):
     '''
-    Internal class for the start_video() webserver. You normally wouldn't use this yourself
+    Internal class for the start_video() webserver requests. Serves the preview from the servers directory. You normally wouldn't use this yourself
     '''
 
     def do_GET(self) -> None:
@@ -25,19 +36,24 @@ class _TelloWebRec(BaseHTTPRequestHandler):
             self.send_header('content-type', 'application/x-mpegURL')
             self.end_headers()
 
-            with open('./web/play.m3u8') as f:
-                self.wfile.writelines(f.buffer)
+            try:
+                with open(f'{self.server.directory}/play.m3u8', 'rb') as f:
+                    self.wfile.write(f.read())
+            except FileNotFoundError:
+                pass
 
-        elif self.path.endswith('.ts'):
+        elif self.path.endswith('.ts') and '/' not in self.path[1:]:
             try:
-                self.send_response(200) 
-                self.send_header('content-type', 'application/x-mpegURL')
-                self.end_headers()
-                with open(f'./web{self.path}') as f:
-                    self.wfile.writelines(f.buffer)
-            except:
+                with open(f'{self.server.directory}{self.path}', 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
                 self.send_response(404)
                 self.end_headers()
+            else:
+                self.send_response(200) 
+                self.send_header('content-type', 'video/mp2t')
+                self.end_headers()
+                self.wfile.write(data)
 
         else:
             self.send_response(404)
@@ -46,9 +62,20 @@ class _TelloWebRec(BaseHTTPRequestHandler):
     def log_message(self, *_) -> None:
         pass
 
+class _TelloWebLiveServer(ThreadingHTTPServer):
+    '''
+    Internal class for the live() webserver. Keeps the HLS playlist and segments ffmpeg uploads in memory. You normally wouldn't use this yourself
+    '''
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int]) -> None:
+        super().__init__(address, _TelloWebLive)
+        self.files = {}
+
 class _TelloWebLive(BaseHTTPRequestHandler):
     '''
-    Internal class for the live() webserver. You normally wouldn't use this yourself
+    Internal class for the live() webserver requests. ffmpeg PUTs and DELETEs the HLS files while the browser GETs them. You normally wouldn't use this yourself
     '''
 
     def do_GET(self) -> None:
@@ -65,23 +92,39 @@ class _TelloWebLive(BaseHTTPRequestHandler):
             self.send_header('content-type', 'application/x-mpegURL')
             self.end_headers()
 
-            with open('./web/play.m3u8') as f:
-                self.wfile.writelines(f.buffer)
+            self.wfile.write(self.server.files.get(self.path, b''))
 
-        elif self.path.endswith('.ts'):
-            try:
-                self.send_response(200) 
-                self.send_header('content-type', 'application/x-mpegURL')
-                self.end_headers()
-                with open(f'./web{self.path}') as f:
-                    self.wfile.writelines(f.buffer)
-            except:
-                self.send_response(404)
-                self.end_headers()
+        elif self.path in self.server.files:
+            self.send_response(200) 
+            self.send_header('content-type', 'video/mp2t')
+            self.end_headers()
+
+            self.wfile.write(self.server.files[self.path])
 
         else:
             self.send_response(404)
             self.end_headers()
 
+    def do_PUT(self) -> None:
+        if self.headers.get('transfer-encoding') == 'chunked':
+            body = bytearray()
+            while size := int(self.rfile.readline().split(b';')[0], 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers.get('content-length', 0)))
+
+        self.server.files[self.path] = bytes(body)
+
+        self.send_response(200)
+        self.end_headers()
+
+    def do_DELETE(self) -> None:
+        self.server.files.pop(self.path, None)
+
+        self.send_response(200)
+        self.end_headers()
+
     def log_message(self, *_) -> None:
         pass
\ No newline at end of file